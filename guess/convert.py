@@ -2,7 +2,8 @@
 Conversion logic for handling converter operations.
 """
 
-from typing import List, Dict, NamedTuple
+from typing import Dict, Iterator, List, NamedTuple
+from guess.converters.base import input_shape
 
 
 class ConversionResult(NamedTuple):
@@ -47,6 +48,44 @@ def _build_result_dict(converter, interpretation, formats: Dict[str, str]) -> Co
     )
 
 
+def iter_convert(input_str: str, converters: List) -> Iterator[ConversionResult]:
+    """
+    Lazily convert input using all applicable converters.
+
+    Yields results in the same order as try_convert, but only runs each
+    converter when the caller asks for the next result. Callers that need just
+    the first match can use next(iter_convert(...), None) and skip the rest.
+
+    Args:
+        input_str: The input string to convert
+        converters: List of converter instances to try
+
+    Yields:
+        ConversionResult objects from converters that can handle the input.
+    """
+    build_result = _build_result_dict
+
+    # Every converter strips surrounding whitespace first; doing it once here
+    # makes their own strip() calls return the same string without copying.
+    # Case folding is left to each converter since some are case-sensitive.
+    input_str = input_str.strip()
+    shape = input_shape(input_str)
+
+    for converter in converters:
+        # Skip converters whose inputs never contain these kinds of characters
+        if not converter.ACCEPTS_MASK & shape:
+            continue
+
+        # Bind bound methods once per converter rather than per interpretation
+        convert_value = converter.convert_value
+        interpretations = converter.get_interpretations(input_str)
+
+        for interpretation in interpretations:
+            formats = convert_value(interpretation.value)
+            if formats:
+                yield build_result(converter, interpretation, formats)
+
+
 def try_convert(input_str: str, converters: List) -> List[ConversionResult]:
     """
     Try to convert input using all applicable converters.
@@ -63,16 +102,4 @@ def try_convert(input_str: str, converters: List) -> List[ConversionResult]:
         A list of ConversionResult objects from converters that can handle the input.
         Returns empty list if no converters can handle the input.
     """
-    results = []
-
-    for converter in converters:
-        interpretations = converter.get_interpretations(input_str)
-
-        for interpretation in interpretations:
-            formats = converter.convert_value(interpretation.value)
-            if formats:
-                results.append(
-                    _build_result_dict(converter, interpretation, formats)
-                )
-
-    return results
\ No newline at end of file
+    return list(iter_convert(input_str, converters))
@@ -2,8 +2,45 @@
 Base converter class that all converters inherit from.
 """
 
-from abc import ABC, abstractmethod
-from typing import Dict, Any, List, NamedTuple
+from functools import lru_cache
+from typing import Dict, Any, List, NamedTuple, Tuple
+
+# Character classes used to describe the rough shape of an input string.
+# Converters declare which classes their inputs can contain so the dispatcher
+# can skip converters that cannot possibly match.
+SHAPE_DIGIT = 1
+SHAPE_DOT = 2
+SHAPE_COLON = 4
+SHAPE_LETTER = 8
+SHAPE_DASH = 16
+SHAPE_OTHER = 32
+SHAPE_ANY = (
+    SHAPE_DIGIT | SHAPE_DOT | SHAPE_COLON | SHAPE_LETTER | SHAPE_DASH | SHAPE_OTHER
+)
+
+
+def input_shape(input_str: str) -> int:
+    """
+    Classify the characters of an input string into a SHAPE_* bitmask.
+
+    Example:
+        input_shape("1.5gb") -> SHAPE_DIGIT | SHAPE_DOT | SHAPE_LETTER
+    """
+    shape = 0
+    for char in input_str:
+        if char.isdigit():
+            shape |= SHAPE_DIGIT
+        elif char.isalpha():
+            shape |= SHAPE_LETTER
+        elif char == ".":
+            shape |= SHAPE_DOT
+        elif char == ":":
+            shape |= SHAPE_COLON
+        elif char == "-":
+            shape |= SHAPE_DASH
+        elif not char.isspace():
+            shape |= SHAPE_OTHER
+    return shape
 
 
 class Interpretation(NamedTuple):
@@ -21,18 +58,35 @@ class Interpretation(NamedTuple):
     value: Any
 
 
-class Converter(ABC):
+@lru_cache(maxsize=4096)
+def _parse_cached(parse, normalized: str) -> Tuple[Interpretation, ...]:
+    """Run a converter's parse hook, memoized by the hook and normalized input."""
+    return parse(normalized)
+
+
+class Converter:
     """
     Base class for all data format converters.
 
-    This abstract base class defines the interface that all converters must implement.
+    This base class defines the interface that all converters must implement.
+    It is a plain class rather than an ABC so that instantiating converters
+    does not go through ABCMeta's abstract method checks.
     Each converter is responsible for:
     1. Detecting possible interpretations of input strings
     2. Converting each interpretation to various related formats
     3. Providing a human-readable name for display
+
+    ACCEPTS_MASK lists the SHAPE_* character classes that can appear in input
+    this converter understands. Input containing none of them is never passed
+    to get_interpretations. The default accepts anything.
+
+    Converters can either override get_interpretations, or implement the
+    _parse_input classmethod and inherit a get_interpretations that memoizes
+    its results by normalized input.
     """
 
-    @abstractmethod
+    ACCEPTS_MASK = SHAPE_ANY
+
     def get_interpretations(self, input_str: str) -> List[Interpretation]:
         """
         Get all possible interpretations of the input string.
@@ -52,9 +106,26 @@ class Converter(ABC):
                 Interpretation(description="rgb color component", value=255)
             ]
         """
-        pass
+        # The cache is keyed on the class-bound hook rather than a bound
+        # method, so it holds no reference to the converter instance. A fresh
+        # list per call lets callers modify it without touching the cache.
+        normalized = self._normalize_input(input_str)
+        return list(_parse_cached(self._parse_input, normalized))
+
+    def _normalize_input(self, input_str: str) -> str:
+        """Normalize input before parsing; the default strips whitespace."""
+        return input_str.strip()
+
+    @classmethod
+    def _parse_input(cls, normalized: str) -> Tuple[Interpretation, ...]:
+        """
+        Parse normalized input into a tuple of interpretations.
+
+        This is a classmethod so the shared cache never keeps converter
+        instances alive. Results must depend on the input alone.
+        """
+        raise NotImplementedError
 
-    @abstractmethod
     def convert_value(self, value: Any) -> Dict[str, str]:
         """
         Convert a parsed value to various output formats.
@@ -70,9 +141,8 @@ class Converter(ABC):
             For value=255 in NumberConverter:
             {"Decimal": "255", "Hexadecimal": "0xff", "Binary": "0b11111111"}
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_name(self) -> str:
         """
         Get the human-readable name of this converter.
@@ -83,9 +153,8 @@ class Converter(ABC):
         Example:
             "Number Base", "Timestamp", "Duration"
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def choose_display_value(
         self, formats: Dict[str, str], interpretation_description: str
     ) -> str:
@@ -100,7 +169,10 @@ class Converter(ABC):
             The preferred format value, or None if the preferred format doesn't exist.
             The caller will use the first available value if None is returned.
 
+        The default implementation returns None, so converters without a
+        preferred format need not override it.
+
         Example:
             For NumberConverter: return formats.get("Human Readable")
         """
-        pass
+        return None
@@ -2,134 +2,129 @@
 Byte size converter for data storage units.
 """
 
-import re
+from functools import lru_cache
 from typing import Dict, Any, List, Union, Tuple
-from guess.converters.base import Converter, Interpretation
+from guess.converters.base import Converter, Interpretation, SHAPE_DIGIT
+
+# Unit multipliers: decimal (1000-based) and binary (1024-based, with 'i')
+_UNIT_MULTIPLIERS = {
+    "b": 1,
+    "kb": 1000,
+    "mb": 1000**2,
+    "gb": 1000**3,
+    "tb": 1000**4,
+    "pb": 1000**5,
+    "eb": 1000**6,
+    "kib": 1024,
+    "mib": 1024**2,
+    "gib": 1024**3,
+    "tib": 1024**4,
+    "pib": 1024**5,
+    "eib": 1024**6,
+}
+
+# Display units in increasing order of size
+_DECIMAL_UNITS = (
+    (1000, "KB"),
+    (1000**2, "MB"),
+    (1000**3, "GB"),
+    (1000**4, "TB"),
+    (1000**5, "PB"),
+    (1000**6, "EB"),
+)
+_BINARY_UNITS = (
+    (1024, "KiB"),
+    (1024**2, "MiB"),
+    (1024**3, "GiB"),
+    (1024**4, "TiB"),
+    (1024**5, "PiB"),
+    (1024**6, "EiB"),
+)
+
+
+@lru_cache(maxsize=1024)
+def _format_bytes(total_bytes: int) -> Tuple[Tuple[str, str], ...]:
+    """Format a byte count as (format name, value) pairs, memoized by value."""
+    result = {}
+
+    # Add raw byte count
+    result["Raw Bytes"] = f"{total_bytes} bytes"
+
+    # Add the largest decimal unit that fits, found from the digit count
+    decimal_tier = min((len(str(total_bytes)) - 1) // 3, len(_DECIMAL_UNITS))
+    if decimal_tier > 0:
+        divisor, unit = _DECIMAL_UNITS[decimal_tier - 1]
+        result["Decimal"] = f"{total_bytes / divisor:.2f} {unit}"
+
+    # Add the largest binary unit that fits, found from the bit length
+    binary_tier = min((total_bytes.bit_length() - 1) // 10, len(_BINARY_UNITS))
+    if binary_tier > 0:
+        divisor, unit = _BINARY_UNITS[binary_tier - 1]
+        result["Binary"] = f"{total_bytes / divisor:.2f} {unit}"
+
+    return tuple(result.items())
 
 
 class ByteSizeConverter(Converter):
     """Converts byte sizes between different units."""
 
+    # Byte sizes always contain a number
+    ACCEPTS_MASK = SHAPE_DIGIT
+
     def get_interpretations(self, input_str: str) -> List[Interpretation]:
         """Get all possible interpretations of the input as a byte size."""
         cleaned = input_str.strip().lower()
         interpretations = []
 
-        # Check for pure numbers (assume bytes)
-        if cleaned.isdigit():
+        # Check for pure numbers (assume bytes). isdecimal() accepts exactly
+        # the digits int() parses, keeping out signs and underscores as well
+        # as digit-like characters such as superscripts.
+        if cleaned.isdecimal():
             size = int(cleaned)
             if size >= 1024:  # Only consider reasonable byte sizes
                 interpretations.append(Interpretation(description="bytes", value=size))
 
-        # Check for unit-based input
-        elif re.match(r"^\d+(?:\.\d+)?\s*([kmgtpe]?i?b)$", cleaned):
-            try:
-                value, unit = self._parse_byte_units(cleaned)
-                if value is not None:
-                    interpretations.append(
-                        Interpretation(
-                            description=self._format_unit_display(unit), value=value
-                        )
+        # Check for unit-based input. Every unit ends in "b", so a cheap
+        # first/last character test rejects most non-size inputs before
+        # _parse_byte_units does the full parse.
+        elif cleaned and cleaned[0].isdigit() and cleaned[-1] == "b":
+            value, unit = self._parse_byte_units(cleaned)
+            if value is not None:
+                interpretations.append(
+                    Interpretation(
+                        description=self._format_unit_display(unit), value=value
                     )
-            except ValueError:
-                pass
+                )
 
         return interpretations
 
     def convert_value(self, value: Any) -> Dict[str, str]:
         """Convert a byte size value to various formats."""
-        total_bytes = value
-
-        # Decimal (1000-based) units
-        decimal_units = []
-        if total_bytes >= 1000**6:
-            decimal_units.append(f"{total_bytes / 1000**6:.2f} EB")
-        if total_bytes >= 1000**5:
-            decimal_units.append(f"{total_bytes / 1000**5:.2f} PB")
-        if total_bytes >= 1000**4:
-            decimal_units.append(f"{total_bytes / 1000**4:.2f} TB")
-        if total_bytes >= 1000**3:
-            decimal_units.append(f"{total_bytes / 1000**3:.2f} GB")
-        if total_bytes >= 1000**2:
-            decimal_units.append(f"{total_bytes / 1000**2:.2f} MB")
-        if total_bytes >= 1000:
-            decimal_units.append(f"{total_bytes / 1000:.2f} KB")
-
-        # Binary (1024-based) units
-        binary_units = []
-        if total_bytes >= 1024**6:
-            binary_units.append(f"{total_bytes / 1024**6:.2f} EiB")
-        if total_bytes >= 1024**5:
-            binary_units.append(f"{total_bytes / 1024**5:.2f} PiB")
-        if total_bytes >= 1024**4:
-            binary_units.append(f"{total_bytes / 1024**4:.2f} TiB")
-        if total_bytes >= 1024**3:
-            binary_units.append(f"{total_bytes / 1024**3:.2f} GiB")
-        if total_bytes >= 1024**2:
-            binary_units.append(f"{total_bytes / 1024**2:.2f} MiB")
-        if total_bytes >= 1024:
-            binary_units.append(f"{total_bytes / 1024:.2f} KiB")
-
-        result = {}
-
-        # Add raw byte count
-        result["Raw Bytes"] = f"{total_bytes} bytes"
-
-        # Add decimal units if available
-        if decimal_units:
-            result["Decimal"] = decimal_units[0]
-
-        # Add binary units if available
-        if binary_units:
-            result["Binary"] = binary_units[0]
-
-        return result
+        return dict(_format_bytes(value))
 
     def _parse_byte_units(self, input_str: str) -> Union[Tuple[int, str], Tuple[None, None]]:
         """Parse byte size string with units like '1GB', '2.5GiB', etc."""
-        # Unit multipliers
-        decimal_multipliers = {
-            "b": 1,
-            "kb": 1000,
-            "mb": 1000**2,
-            "gb": 1000**3,
-            "tb": 1000**4,
-            "pb": 1000**5,
-            "eb": 1000**6,
-        }
-
-        binary_multipliers = {
-            "b": 1,
-            "kib": 1024,
-            "mib": 1024**2,
-            "gib": 1024**3,
-            "tib": 1024**4,
-            "pib": 1024**5,
-            "eib": 1024**6,
-        }
-
-        # Extract number and unit
-        pattern = r"^(\d+(?:\.\d+)?)\s*([kmgtpe]?i?b)$"
-        match = re.match(pattern, input_str)
-
-        if not match:
-            return None, None
+        # Split off the unit letters, allowing whitespace before the unit
+        number = input_str.rstrip("kmgtpeib")
+        unit = input_str[len(number):]
+        number = number.rstrip()
 
-        value_str, unit = match.groups()
+        multiplier = _UNIT_MULTIPLIERS.get(unit)
+        if multiplier is None:
+            return None, None
 
         try:
-            value = float(value_str)
-
-            # Determine if it's binary (with 'i') or decimal
-            if "i" in unit:
-                multiplier = binary_multipliers.get(unit, 1)
-            else:
-                multiplier = decimal_multipliers.get(unit, 1)
-
-            return int(value * multiplier), unit
+            # Whole numbers stay in integer arithmetic to avoid float rounding
+            if number.isdigit():
+                return int(number) * multiplier, unit
 
+            whole, _, fraction = number.partition(".")
+            if whole.isdigit() and fraction.isdigit():
+                return int(float(number) * multiplier), unit
         except ValueError:
-            return None, None
+            pass
+
+        return None, None
 
     def _format_unit_display(self, unit: str) -> str:
         """Format unit for display: uppercase letters but keep 'i' lowercase for binary units."""
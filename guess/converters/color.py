@@ -8,237 +8,261 @@ This module implements color conversion algorithms based on established standard
 - ANSI Escape Codes: ECMA-48 Standard
 """
 
+import math
 import re
-from typing import Dict, Any, List
+from functools import lru_cache
+from itertools import repeat
+from typing import Dict, Any, Tuple
 from guess.converters.base import Converter, Interpretation
 from guess.css_colors import CSS_COLORS
 
+# Input formats; once one matches, its numbers are split out by comma.
+# The rgb() forms share one pattern and the named group that matched
+# (match.lastgroup) tells them apart, tried in order int, float, percent.
+_RGB_RE = re.compile(
+    r"^rgb\(\s*(?:"
+    r"(?P<int>\d+\s*,\s*\d+\s*,\s*\d+)"
+    r"|(?P<float>\d*\.?\d+\s*,\s*\d*\.?\d+\s*,\s*\d*\.?\d+)"
+    r"|(?P<percent>\d+%\s*,\s*\d+%\s*,\s*\d+%)"
+    r")\s*\)$"
+)
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+_HSL_RE = re.compile(r"^hsl\(\s*\d+\s*,\s*\d+%?\s*,\s*\d+%?\s*\)$")
+
+
+def _srgb_to_linear(value: int) -> float:
+    """Expand one 8-bit sRGB channel to linear light (0-1).
+
+    Reference: https://en.wikipedia.org/wiki/SRGB#From_sRGB_to_CIE_XYZ
+    """
+    norm = value / 255.0
+    # Apply gamma correction (sRGB gamma function)
+    return ((norm + 0.055) / 1.055) ** 2.4 if norm > 0.04045 else norm / 12.92
+
+
+# Channels are always whole 0-255 values when converted to XYZ, so the costly
+# gamma expansion is tabulated once for all of them
+_SRGB_TO_LINEAR = [_srgb_to_linear(value) for value in range(256)]
+
+# Whole 8-bit channels scaled to 0-1, for HSL conversion
+_CHANNEL_TO_UNIT = [value / 255.0 for value in range(256)]
+
+# Two-digit hex for each 8-bit channel, for hex color codes
+_CHANNEL_TO_HEX = [f"{value:02x}" for value in range(256)]
+
+# sRGB to XYZ matrix (D65 observer at 2°) with the 0-100 XYZ scale and the
+# division by the D65 reference white (95.047, 100.000, 108.883) folded in,
+# so each row directly yields the normalized X/Xn, Y/Yn, Z/Zn used by CIELAB.
+# References:
+# - http://www.brucelindbloom.com/index.html?Eqn_RGB_XYZ_Matrix.html
+# - https://en.wikipedia.org/wiki/Illuminant_D65
+_XR, _XG, _XB = 0.4124564 / 0.95047, 0.3575761 / 0.95047, 0.1804375 / 0.95047
+_YR, _YG, _YB = 0.2126729, 0.7151522, 0.0721750
+_ZR, _ZG, _ZB = 0.0193339 / 1.08883, 0.1191920 / 1.08883, 0.9503041 / 1.08883
+
+
+def _hue_to_rgb(p: float, q: float, t: float) -> float:
+    """Compute one RGB channel (0-1) from HSL intermediates and a hue offset.
+
+    Reference: https://www.w3.org/TR/css-color-3/#hsl-color
+    """
+    if t < 0:
+        t += 1
+    if t > 1:
+        t -= 1
+    if t < 1 / 6:
+        return p + (q - p) * 6 * t
+    if t < 1 / 2:
+        return q
+    if t < 2 / 3:
+        return p + (q - p) * (2 / 3 - t) * 6
+    return p
+
+
+def _rgb_to_lab(r: int, g: int, b: int) -> tuple:
+    """Convert RGB to CIELAB color space, going through XYZ.
+
+    References:
+    - http://www.brucelindbloom.com/index.html?Eqn_RGB_to_XYZ.html
+    - https://en.wikipedia.org/wiki/SRGB#From_sRGB_to_CIE_XYZ
+    - IEC 61966-2-1:1999 standard (sRGB color space)
+    - http://www.brucelindbloom.com/index.html?Eqn_XYZ_to_Lab.html
+    - https://en.wikipedia.org/wiki/CIELAB_color_space#From_CIEXYZ_to_CIELAB
+    - CIE 15:2004 Colorimetry standard
+    """
+    # Gamma-expanded channels, looked up per 8-bit value
+    r_lin = _SRGB_TO_LINEAR[r]
+    g_lin = _SRGB_TO_LINEAR[g]
+    b_lin = _SRGB_TO_LINEAR[b]
+
+    # XYZ relative to the D65 reference white, see _XR and friends
+    x_norm = r_lin * _XR + g_lin * _XG + b_lin * _XB
+    y_norm = r_lin * _YR + g_lin * _YG + b_lin * _YB
+    z_norm = r_lin * _ZR + g_lin * _ZG + b_lin * _ZB
+
+    # CIE LAB conversion threshold and formula
+    # Reference: http://www.brucelindbloom.com/index.html?Eqn_XYZ_to_Lab.html
+    threshold = 0.008856
+    x_norm = x_norm ** (1/3) if x_norm > threshold else (7.787 * x_norm) + 16/116
+    y_norm = y_norm ** (1/3) if y_norm > threshold else (7.787 * y_norm) + 16/116
+    z_norm = z_norm ** (1/3) if z_norm > threshold else (7.787 * z_norm) + 16/116
+
+    L = (116 * y_norm) - 16
+    a = 500 * (x_norm - y_norm)
+    b = 200 * (y_norm - z_norm)
+
+    return (L, a, b)
+
+
+# CSS names we may suggest for an RGB value, with their CIELAB coordinates
+# computed once so closest-color lookups only convert the target color
+_CSS_NAMES = [
+    name for name in CSS_COLORS if not name.endswith("grey") and name != "aqua"
+]
+_CSS_LAB = [_rgb_to_lab(*CSS_COLORS[name]) for name in _CSS_NAMES]
+
+# Reverse lookup for exact matches; built back to front so the first name
+# listed for an RGB value wins (e.g. "fuchsia" over "magenta")
+_RGB_TO_NAME = {CSS_COLORS[name]: name for name in reversed(_CSS_NAMES)}
+
+
+@lru_cache(maxsize=1024)
+def _closest_css_name(r: int, g: int, b: int) -> str:
+    """Find the CSS color name closest to whole RGB channels in CIELAB space."""
+    # Convert target color to LAB space once
+    target_lab = _rgb_to_lab(r, g, b)
+
+    distances = list(map(math.dist, repeat(target_lab), _CSS_LAB))
+    return _CSS_NAMES[distances.index(min(distances))]
+
+
+# ANSI escape sequence that resets terminal colors
+_ANSI_RESET = "\033[0m"
+
 
 class ColorConverter(Converter):
     """Converts colors between different formats."""
 
-    def __init__(self):
-        # Use CSS color names from W3C CSS Color Module Level 3 specification
-        self.color_names = CSS_COLORS
+    # Use CSS color names from W3C CSS Color Module Level 3 specification
+    color_names = CSS_COLORS
 
-    def get_interpretations(self, input_str: str) -> List[Interpretation]:
-        """Get all possible interpretations of the input as a color."""
-        cleaned = input_str.strip()
+    @classmethod
+    def _parse_input(cls, cleaned: str) -> Tuple[Interpretation, ...]:
+        """Parse a stripped input string into color interpretations."""
         interpretations = []
 
-        # Check for 6-digit hex color codes (#112233)
-        if re.match(r"^#[0-9a-fA-F]{6}$", cleaned):
-            try:
-                r = int(cleaned[1:3], 16)
-                g = int(cleaned[3:5], 16)
-                b = int(cleaned[5:7], 16)
+        # Dispatch on the leading characters so that only the regexes for the
+        # matching format family run
+        if cleaned.startswith("#"):
+            # Check for 6-digit (#112233) and 3-digit (#123) hex color codes
+            digits = cleaned[1:]
+            if len(digits) in (3, 6) and _HEX_DIGITS.issuperset(digits):
+                if len(digits) == 3:
+                    # "123" becomes "112233"
+                    digits = digits[0] * 2 + digits[1] * 2 + digits[2] * 2
+                # fromhex parses all three channels at once
+                r, g, b = bytes.fromhex(digits)
                 interpretations.append(
                     Interpretation(description="hex", value=(r, g, b))
                 )
-            except ValueError:
-                pass
-
-        # Check for 3-digit hex color codes (#123)
-        elif re.match(r"^#[0-9a-fA-F]{3}$", cleaned):
-            try:
-                r = int(cleaned[1] * 2, 16)  # "1" becomes "11"
-                g = int(cleaned[2] * 2, 16)  # "2" becomes "22"
-                b = int(cleaned[3] * 2, 16)  # "3" becomes "33"
+
+        elif cleaned.startswith("rgb("):
+            match = _RGB_RE.match(cleaned)
+            rgb_format = match.lastgroup if match else None
+
+            # Check for rgb() format with integers [0-255]
+            if rgb_format == "int":
+                try:
+                    # Extract numbers from rgb(r, g, b)
+                    r, g, b = map(int, cleaned[4:-1].split(","))
+                    if all(0 <= val <= 255 for val in [r, g, b]):
+                        interpretations.append(
+                            Interpretation(description="rgb", value=(r, g, b))
+                        )
+                except (ValueError, IndexError):
+                    pass
+
+            # Check for rgb() format with floats [0-1]
+            elif rgb_format == "float":
+                try:
+                    # Extract float numbers from rgb(r, g, b)
+                    r_f, g_f, b_f = map(float, cleaned[4:-1].split(","))
+                    if all(0.0 <= val <= 1.0 for val in [r_f, g_f, b_f]):
+                        # Convert to 0-255 range, preserving precision
+                        r = r_f * 255
+                        g = g_f * 255
+                        b = b_f * 255
+                        interpretations.append(
+                            Interpretation(description="rgb", value=(r, g, b))
+                        )
+                except (ValueError, IndexError):
+                    pass
+
+            # Check for rgb() format with percentages [0-100%]
+            elif rgb_format == "percent":
+                try:
+                    # Extract percentage numbers from rgb(r%, g%, b%)
+                    numbers = cleaned[4:-1].replace("%", "").split(",")
+                    r_p, g_p, b_p = map(int, numbers)
+                    if all(0 <= val <= 100 for val in [r_p, g_p, b_p]):
+                        # Convert to 0-255 range, preserving precision
+                        r = r_p * 255 / 100
+                        g = g_p * 255 / 100
+                        b = b_p * 255 / 100
+                        interpretations.append(
+                            Interpretation(description="rgb", value=(r, g, b))
+                        )
+                except (ValueError, IndexError):
+                    pass
+
+        elif cleaned.startswith("hsl("):
+            # Check for hsl() format
+            if _HSL_RE.match(cleaned):
+                try:
+                    # Extract numbers from hsl(h, s%, l%)
+                    numbers = cleaned[4:-1].replace("%", "").split(",")
+                    h, s, lightness = map(int, numbers)
+                    if 0 <= h <= 360 and 0 <= s <= 100 and 0 <= lightness <= 100:
+                        r, g, b = cls._hsl_to_rgb(h, s, lightness)
+                        interpretations.append(
+                            Interpretation(description="hsl", value=(r, g, b))
+                        )
+                except (ValueError, IndexError):
+                    pass
+
+        # Check for color names (normalize by removing spaces and converting to lowercase)
+        else:
+            rgb = cls.color_names.get(cls._normalize_color_name(cleaned))
+            if rgb is not None:
                 interpretations.append(
-                    Interpretation(description="hex", value=(r, g, b))
+                    Interpretation(description="css name", value=rgb)
                 )
-            except ValueError:
-                pass
 
-        # Check for color names (normalize by removing spaces and converting to lowercase)
-        elif self._normalize_color_name(cleaned) in self.color_names:
-            rgb = self.color_names[self._normalize_color_name(cleaned)]
-            interpretations.append(Interpretation(description="css name", value=rgb))
-
-        # Check for rgb() format with integers [0-255]
-        elif re.match(r"^rgb\(\s*\d+\s*,\s*\d+\s*,\s*\d+\s*\)$", cleaned):
-            try:
-                # Extract numbers from rgb(r, g, b)
-                numbers = re.findall(r"\d+", cleaned)
-                r, g, b = map(int, numbers)
-                if all(0 <= val <= 255 for val in [r, g, b]):
-                    interpretations.append(
-                        Interpretation(description="rgb", value=(r, g, b))
-                    )
-            except (ValueError, IndexError):
-                pass
-
-        # Check for rgb() format with floats [0-1]
-        elif re.match(
-            r"^rgb\(\s*\d*\.?\d+\s*,\s*\d*\.?\d+\s*,\s*\d*\.?\d+\s*\)$", cleaned
-        ):
-            try:
-                # Extract float numbers from rgb(r, g, b)
-                numbers = re.findall(r"\d*\.?\d+", cleaned)
-                r_f, g_f, b_f = map(float, numbers)
-                if all(0.0 <= val <= 1.0 for val in [r_f, g_f, b_f]):
-                    # Convert to 0-255 range, preserving precision
-                    r = r_f * 255
-                    g = g_f * 255
-                    b = b_f * 255
-                    interpretations.append(
-                        Interpretation(description="rgb", value=(r, g, b))
-                    )
-            except (ValueError, IndexError):
-                pass
-
-        # Check for rgb() format with percentages [0-100%]
-        elif re.match(r"^rgb\(\s*\d+%\s*,\s*\d+%\s*,\s*\d+%\s*\)$", cleaned):
-            try:
-                # Extract percentage numbers from rgb(r%, g%, b%)
-                numbers = re.findall(r"\d+", cleaned)
-                r_p, g_p, b_p = map(int, numbers)
-                if all(0 <= val <= 100 for val in [r_p, g_p, b_p]):
-                    # Convert to 0-255 range, preserving precision
-                    r = r_p * 255 / 100
-                    g = g_p * 255 / 100
-                    b = b_p * 255 / 100
-                    interpretations.append(
-                        Interpretation(description="rgb", value=(r, g, b))
-                    )
-            except (ValueError, IndexError):
-                pass
-
-        # Check for hsl() format
-        elif re.match(r"^hsl\(\s*\d+\s*,\s*\d+%?\s*,\s*\d+%?\s*\)$", cleaned):
-            try:
-                # Extract numbers from hsl(h, s%, l%)
-                numbers = re.findall(r"\d+", cleaned)
-                h, s, lightness = map(int, numbers)
-                if 0 <= h <= 360 and 0 <= s <= 100 and 0 <= lightness <= 100:
-                    r, g, b = self._hsl_to_rgb(h, s, lightness)
-                    interpretations.append(
-                        Interpretation(description="hsl", value=(r, g, b))
-                    )
-            except (ValueError, IndexError):
-                pass
-
-        return interpretations
-
-    def _normalize_color_name(self, name: str) -> str:
+        return tuple(interpretations)
+
+    @staticmethod
+    def _normalize_color_name(name: str) -> str:
         """Normalize color name by removing spaces and converting to lowercase."""
         return name.replace(" ", "").lower()
 
     def _find_color_name(self, r: float, g: float, b: float) -> str:
         """Find color name for RGB values, preferring certain names over others."""
-        rounded_rgb = (round(r), round(g), round(b))
-        for name, rgb in self.color_names.items():
-            if rgb == rounded_rgb and not name.endswith("grey") and name != "aqua":
-                return name
-        return None
-
-    def _rgb_to_xyz(self, r: int, g: int, b: int) -> tuple:
-        """Convert RGB to XYZ color space (intermediate step for CIELAB).
-
-        References:
-        - http://www.brucelindbloom.com/index.html?Eqn_RGB_to_XYZ.html
-        - https://en.wikipedia.org/wiki/SRGB#From_sRGB_to_CIE_XYZ
-        - IEC 61966-2-1:1999 standard (sRGB color space)
-        """
-        r_norm = r / 255.0
-        g_norm = g / 255.0
-        b_norm = b / 255.0
-
-        # Apply gamma correction (sRGB gamma function)
-        # Reference: https://en.wikipedia.org/wiki/SRGB#From_sRGB_to_CIE_XYZ
-        r_norm = ((r_norm + 0.055) / 1.055) ** 2.4 if r_norm > 0.04045 else r_norm / 12.92
-        g_norm = ((g_norm + 0.055) / 1.055) ** 2.4 if g_norm > 0.04045 else g_norm / 12.92
-        b_norm = ((b_norm + 0.055) / 1.055) ** 2.4 if b_norm > 0.04045 else b_norm / 12.92
-
-        r_norm *= 100
-        g_norm *= 100
-        b_norm *= 100
-
-        # Convert to XYZ using D65 observer at 2° (sRGB transformation matrix)
-        # Reference: http://www.brucelindbloom.com/index.html?Eqn_RGB_XYZ_Matrix.html
-        x = r_norm * 0.4124564 + g_norm * 0.3575761 + b_norm * 0.1804375
-        y = r_norm * 0.2126729 + g_norm * 0.7151522 + b_norm * 0.0721750
-        z = r_norm * 0.0193339 + g_norm * 0.1191920 + b_norm * 0.9503041
-
-        return (x, y, z)
-
-    def _xyz_to_lab(self, x: float, y: float, z: float) -> tuple:
-        """Convert XYZ to CIELAB color space.
-
-        References:
-        - http://www.brucelindbloom.com/index.html?Eqn_XYZ_to_Lab.html
-        - https://en.wikipedia.org/wiki/CIELAB_color_space#From_CIEXYZ_to_CIELAB
-        - CIE 15:2004 Colorimetry standard
-        """
-        # D65 reference white (CIE standard illuminant)
-        # Reference: https://en.wikipedia.org/wiki/Illuminant_D65
-        ref_x = 95.047
-        ref_y = 100.000
-        ref_z = 108.883
-
-        x_norm = x / ref_x
-        y_norm = y / ref_y
-        z_norm = z / ref_z
-
-        # CIE LAB conversion threshold and formula
-        # Reference: http://www.brucelindbloom.com/index.html?Eqn_XYZ_to_Lab.html
-        threshold = 0.008856
-        x_norm = x_norm ** (1/3) if x_norm > threshold else (7.787 * x_norm) + 16/116
-        y_norm = y_norm ** (1/3) if y_norm > threshold else (7.787 * y_norm) + 16/116
-        z_norm = z_norm ** (1/3) if z_norm > threshold else (7.787 * z_norm) + 16/116
-
-        L = (116 * y_norm) - 16
-        a = 500 * (x_norm - y_norm)
-        b = 200 * (y_norm - z_norm)
-
-        return (L, a, b)
-
-    def _rgb_to_lab(self, r: int, g: int, b: int) -> tuple:
-        """Convert RGB to CIELAB color space."""
-        xyz = self._rgb_to_xyz(r, g, b)
-        return self._xyz_to_lab(*xyz)
-
-    def _color_distance2(self, lab1: tuple, lab2: tuple) -> float:
-        """Calculate perceptual distance between two LAB colors using Delta E* (1976).
-        References:
-
-        - https://en.wikipedia.org/wiki/Color_difference#CIE76
-        - http://www.brucelindbloom.com/index.html?Eqn_DeltaE_CIE76.html
-        """
-        delta_L = lab1[0] - lab2[0]
-        delta_a = lab1[1] - lab2[1]
-        delta_b = lab1[2] - lab2[2]
-
-        # Return squared distance (no need for sqrt when just comparing magnitudes)
-        return delta_L ** 2 + delta_a ** 2 + delta_b ** 2
+        return _RGB_TO_NAME.get((round(r), round(g), round(b)))
 
     def _find_closest_color(self, r: float, g: float, b: float) -> str:
         """Find the closest CSS color name using perceptual distance in CIELAB color space.
 
+        Distance is Delta E* (1976), the Euclidean distance between LAB
+        coordinates. math.dist is mapped over the precomputed table so the
+        per-color loop runs in C.
+
         References:
         - https://en.wikipedia.org/wiki/Color_difference
+        - https://en.wikipedia.org/wiki/Color_difference#CIE76
         - http://www.brucelindbloom.com/index.html?ColorDifferenceCalc.html
         """
-        # Convert target color to LAB space once
-        target_lab = self._rgb_to_lab(round(r), round(g), round(b))
-
-        min_distance = float('inf')
-        closest_color = None
-
-        for name, rgb in self.color_names.items():
-            # Skip colors we don't want to suggest
-            if name.endswith("grey") or name == "aqua":
-                continue
-
-            # Convert color to LAB space
-            color_lab = self._rgb_to_lab(*rgb)
-
-            distance = self._color_distance2(target_lab, color_lab)
-            if distance < min_distance:
-                min_distance = distance
-                closest_color = name
-
-        return closest_color
+        # The result only depends on the rounded channels, so cache on those
+        return _closest_css_name(round(r), round(g), round(b))
 
     def convert_value(self, value: Any) -> Dict[str, str]:
         """Convert a color value to various formats."""
@@ -251,21 +275,33 @@ class ColorConverter(Converter):
         # Generate output formats
         result = {}
 
-        # RGB values - round for display with color square
+        # Whole channels for display, rounded once for every format below
+        r_int, g_int, b_int = round(r), round(g), round(b)
+
+        # RGB values with color square
         color_square = self._get_color_square(r, g, b)
-        result["RGB"] = f"{color_square} rgb({round(r)}, {round(g)}, {round(b)})"
+        result["RGB"] = f"{color_square} rgb({r_int}, {g_int}, {b_int})"
 
         # RGB percent values (0-100% range)
         result["RGB Percent"] = (
             f"rgb({round(r / 255 * 100)}%, {round(g / 255 * 100)}%, {round(b / 255 * 100)}%)"
         )
 
-        # HSL values
-        h, s, L = self._rgb_to_hsl(r, g, b)
+        # HSL values; whole channels, as from hex codes, names and integer
+        # rgb(), are scaled through a lookup table
+        if r == r_int and g == g_int and b == b_int:
+            h, s, L = self._whole_rgb_to_hsl(r_int, g_int, b_int)
+        else:
+            h, s, L = self._rgb_to_hsl(r, g, b)
         result["HSL"] = f"hsl({round(h)}, {round(s)}%, {round(L)}%)"
 
-        # Hex color code - round for display
-        result["Hex"] = f"#{round(r):02x}{round(g):02x}{round(b):02x}"
+        # Hex color code
+        result["Hex"] = (
+            "#"
+            + _CHANNEL_TO_HEX[r_int]
+            + _CHANNEL_TO_HEX[g_int]
+            + _CHANNEL_TO_HEX[b_int]
+        )
 
         # Color name (if applicable)
         color_name = self._find_color_name(r, g, b)
@@ -280,14 +316,22 @@ class ColorConverter(Converter):
         return result
 
     def _rgb_to_hsl(self, r, g, b):
-        """Convert RGB to HSL, preserving precision.
+        """Convert RGB channels in the 0-255 range to HSL, preserving precision."""
+        return self._unit_rgb_to_hsl(r / 255.0, g / 255.0, b / 255.0)
+
+    def _whole_rgb_to_hsl(self, r: int, g: int, b: int):
+        """Convert whole 0-255 RGB channels to HSL, same as _rgb_to_hsl."""
+        return self._unit_rgb_to_hsl(
+            _CHANNEL_TO_UNIT[r], _CHANNEL_TO_UNIT[g], _CHANNEL_TO_UNIT[b]
+        )
+
+    def _unit_rgb_to_hsl(self, r: float, g: float, b: float):
+        """Convert RGB channels in the 0-1 range to HSL.
 
         References:
         - https://en.wikipedia.org/wiki/HSL_and_HSV#From_RGB
         - https://www.w3.org/TR/css-color-3/#hsl-color
         """
-        r, g, b = r / 255.0, g / 255.0, b / 255.0
-
         max_val = max(r, g, b)
         min_val = min(r, g, b)
         diff = max_val - min_val
@@ -296,28 +340,29 @@ class ColorConverter(Converter):
         L = (max_val + min_val) / 2
 
         if diff == 0:
-            h = s = 0  # achromatic
-        else:
-            # Saturation
-            s = (
-                diff / (2 - max_val - min_val)
-                if L > 0.5
-                else diff / (max_val + min_val)
-            )
+            return (0, 0, L * 100)  # achromatic
 
-            # Hue
-            if max_val == r:
-                h = (g - b) / diff + (6 if g < b else 0)
-            elif max_val == g:
-                h = (b - r) / diff + 2
-            elif max_val == b:
-                h = (r - g) / diff + 4
-            h /= 6
+        # Saturation
+        s = (
+            diff / (2 - max_val - min_val)
+            if L > 0.5
+            else diff / (max_val + min_val)
+        )
+
+        # Hue
+        if max_val == r:
+            h = (g - b) / diff + (6 if g < b else 0)
+        elif max_val == g:
+            h = (b - r) / diff + 2
+        else:
+            h = (r - g) / diff + 4
 
-        # Return precise floating-point values
-        return (h * 360, s * 100, L * 100)
+        # Return precise floating-point values; h / 6 * 360 rather than
+        # h * 60 keeps exact half-degree hues rounding the same way
+        return (h / 6 * 360, s * 100, L * 100)
 
-    def _hsl_to_rgb(self, h: int, s: int, lightness: int):
+    @staticmethod
+    def _hsl_to_rgb(h: int, s: int, lightness: int):
         """Convert HSL to RGB.
 
         References:
@@ -332,29 +377,15 @@ class ColorConverter(Converter):
             # Achromatic (gray)
             r = g = b = lightness
         else:
-
-            def hue_to_rgb(p, q, t):
-                if t < 0:
-                    t += 1
-                if t > 1:
-                    t -= 1
-                if t < 1 / 6:
-                    return p + (q - p) * 6 * t
-                if t < 1 / 2:
-                    return q
-                if t < 2 / 3:
-                    return p + (q - p) * (2 / 3 - t) * 6
-                return p
-
             q = (
                 lightness * (1 + s)
                 if lightness < 0.5
                 else lightness + s - lightness * s
             )
             p = 2 * lightness - q
-            r = hue_to_rgb(p, q, h + 1 / 3)
-            g = hue_to_rgb(p, q, h)
-            b = hue_to_rgb(p, q, h - 1 / 3)
+            r = _hue_to_rgb(p, q, h + 1 / 3)
+            g = _hue_to_rgb(p, q, h)
+            b = _hue_to_rgb(p, q, h - 1 / 3)
 
         return (r * 255, g * 255, b * 255)
 
@@ -372,9 +403,7 @@ class ColorConverter(Converter):
 
         # Create colored square using truecolor ANSI escape sequences
         # Format: \033[48;2;r;g;bm for background color
-        reset = "\033[0m"
-        bg_color = f"\033[48;2;{r_int};{g_int};{b_int}m"
-        return f"{bg_color}  {reset}"
+        return f"\033[48;2;{r_int};{g_int};{b_int}m  {_ANSI_RESET}"
 
     def get_name(self) -> str:
         """Get the name of this converter."""
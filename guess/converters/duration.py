@@ -2,41 +2,114 @@
 Duration converter for time periods and human-readable durations.
 """
 
-import re
-from typing import Dict, Any, List, Tuple
-from guess.converters.base import Converter, Interpretation
+import math
+from typing import Dict, Any, Tuple
+from guess.converters.base import Converter, Interpretation, SHAPE_DIGIT
 from guess.utils import parse_float_unit, format_units
 
+# Seconds per unit letter in compact durations such as "1h30m"
+_UNIT_SECONDS = {
+    "w": 604800,  # week
+    "d": 86400,  # day
+    "h": 3600,  # hour
+    "m": 60,  # minute
+    "s": 1,  # second
+}
+
+# Seconds per unit for "<float> <unit>" durations such as "2.5 hours"
+_TIME_MULTIPLIERS = {
+    "years": 365.25 * 24 * 3600,
+    "weeks": 604800,
+    "days": 86400,
+    "hours": 3600,
+    "minutes": 60,
+    "seconds": 1,
+    "milliseconds": 0.001,
+    "microseconds": 0.000001,
+    "nanoseconds": 0.000000001,
+}
+
+# Alternative spellings of the units above
+_TIME_ALIASES = {
+    "year": "years",
+    "y": "years",
+    "week": "weeks",
+    "w": "weeks",
+    "day": "days",
+    "d": "days",
+    "hour": "hours",
+    "hrs": "hours",
+    "hr": "hours",
+    "h": "hours",
+    "minute": "minutes",
+    "mins": "minutes",
+    "min": "minutes",
+    "m": "minutes",
+    "second": "seconds",
+    "secs": "seconds",
+    "sec": "seconds",
+    "s": "seconds",
+    "millisecond": "milliseconds",
+    "ms": "milliseconds",
+    "microsecond": "microseconds",
+    "us": "microseconds",
+    "μs": "microseconds",
+    "nanosecond": "nanoseconds",
+    "ns": "nanoseconds",
+}
+
+# Sub-second display units, largest first: (threshold in seconds, units per
+# second, unit name)
+_SUBSECOND_UNITS = (
+    (0.001, 1000, "millisecond"),
+    (0.000001, 1000000, "microsecond"),
+    (0.000000001, 1000000000, "nanosecond"),
+)
+
+
+def _split_duration(total_seconds: int) -> Tuple[int, int, int, int, int]:
+    """Split whole seconds into (weeks, days, hours, minutes, seconds)."""
+    minutes, seconds = divmod(total_seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    weeks, days = divmod(days, 7)
+    return weeks, days, hours, minutes, seconds
+
 
 class DurationConverter(Converter):
     """Converts durations between different formats."""
 
-    def get_interpretations(self, input_str: str) -> List[Interpretation]:
-        """Get all possible interpretations of the input as a duration."""
-        cleaned = input_str.strip().lower()
+    # Durations always contain a number
+    ACCEPTS_MASK = SHAPE_DIGIT
+
+    def _normalize_input(self, input_str: str) -> str:
+        """Strip and lowercase the input; units are case-insensitive."""
+        return input_str.strip().lower()
 
+    @classmethod
+    def _parse_input(cls, cleaned: str) -> Tuple[Interpretation, ...]:
+        """Parse a normalized input string into duration interpretations."""
         # Check for pure numbers (assume seconds) - support both integers and floats
         try:
             seconds = float(cleaned)
-            if seconds >= 0:  # Only accept non-negative durations
-                return [Interpretation(description="seconds", value=seconds)]
+            # Only accept non-negative durations; float() also parses "inf",
+            # which has no whole number of seconds to format
+            if 0 <= seconds < math.inf:
+                return (Interpretation(description="seconds", value=seconds),)
         except ValueError:
             pass
 
         # Check for <float> <unit> format (e.g., "2.5 hours", "2.5hours", "1.5 years")
-        value, unit = self._parse_float_unit(cleaned)
+        value, unit = cls._parse_float_unit(cleaned)
         if value is not None:
-            return [Interpretation(description=unit, value=float(value))]
+            return (Interpretation(description=unit, value=float(value)),)
 
         # Check for duration with units (compact format like 1h30m)
-        if re.match(r"^(\d+[wdhms])+$", cleaned):
-            value = self._parse_duration_units(cleaned)
-            if value is not None:
-                return [
-                    Interpretation(description="mixed", value=float(value))
-                ]
+        value = cls._parse_duration_units(cleaned)
+        if value is not None:
+            return (Interpretation(description="mixed", value=float(value)),)
 
-        return []
+        return ()
 
     def convert_value(self, value: Any) -> Dict[str, str]:
         """Convert a duration value to various formats."""
@@ -45,13 +118,14 @@ class DurationConverter(Converter):
         if total_seconds >= 1:
             human_readable = self._format_human_readable_duration(total_seconds)
         else:
-            # For sub-second durations, use a threshold-based display
-            if total_seconds >= 0.001:
-                human_readable = format_units(total_seconds * 1000, "millisecond")
-            elif total_seconds >= 0.000001:
-                human_readable = format_units(total_seconds * 1000000, "microsecond")
+            # For sub-second durations, use the largest unit reaching 1;
+            # anything smaller falls back to the last (nanoseconds)
+            for threshold, scale, unit in _SUBSECOND_UNITS:
+                if total_seconds >= threshold:
+                    break
             else:
-                human_readable = format_units(total_seconds * 1000000000, "nanosecond")
+                _, scale, unit = _SUBSECOND_UNITS[-1]
+            human_readable = format_units(total_seconds * scale, unit)
 
         # Format seconds using utility function to avoid unnecessary decimal points
         seconds_display = format_units(total_seconds, "second")
@@ -84,81 +158,40 @@ class DurationConverter(Converter):
         # Prioritize human readable format
         return formats.get("Human Readable")
 
-    def _parse_duration_units(self, input_str: str) -> int:
-        """Parse duration string with units like '1h30m', '2d4h', etc."""
-        # Unit multipliers in seconds
-        multipliers = {
-            "w": 604800,  # week
-            "d": 86400,  # day
-            "h": 3600,  # hour
-            "m": 60,  # minute
-            "s": 1,  # second
-        }
+    @staticmethod
+    def _parse_duration_units(input_str: str) -> int:
+        """Parse duration string with units like '1h30m', '2d4h', etc.
 
+        Returns None unless the whole string is <digits><unit> groups.
+        """
         total_seconds = 0
+        value = None  # digits read since the last unit, if any
+
+        # Single pass: accumulate each number digit by digit and add it in
+        # as soon as its unit letter is reached
+        for char in input_str:
+            multiplier = _UNIT_SECONDS.get(char)
+            if multiplier is not None:
+                if value is None:
+                    return None
+                total_seconds += value * multiplier
+                value = None
+            elif char.isdecimal():
+                value = (value or 0) * 10 + int(char)
+            else:
+                return None
 
-        # Find all number+unit combinations
-        pattern = r"(\d+)([wdhms])"
-        matches = re.findall(pattern, input_str)
-
-        if not matches:
+        # Reject empty input and trailing digits without a unit
+        if value is not None or not input_str:
             return None
 
-        for value_str, unit in matches:
-            try:
-                value = int(value_str)
-                total_seconds += value * multipliers[unit]
-            except (ValueError, KeyError):
-                return None
-
         return total_seconds
 
-    def _parse_float_unit(self, input_str: str) -> Tuple[float, str]:
+    @staticmethod
+    def _parse_float_unit(input_str: str) -> Tuple[float, str]:
         """Parse float unit format like '2.5 hours', '1.5 years'."""
-        # Define time unit multipliers (in seconds)
-        time_multipliers = {
-            "years": 365.25 * 24 * 3600,
-            "weeks": 604800,
-            "days": 86400,
-            "hours": 3600,
-            "minutes": 60,
-            "seconds": 1,
-            "milliseconds": 0.001,
-            "microseconds": 0.000001,
-            "nanoseconds": 0.000000001,
-        }
-
-        # Define aliases for time units
-        time_aliases = {
-            "year": "years",
-            "y": "years",
-            "week": "weeks",
-            "w": "weeks",
-            "day": "days",
-            "d": "days",
-            "hour": "hours",
-            "hrs": "hours",
-            "hr": "hours",
-            "h": "hours",
-            "minute": "minutes",
-            "mins": "minutes",
-            "min": "minutes",
-            "m": "minutes",
-            "second": "seconds",
-            "secs": "seconds",
-            "sec": "seconds",
-            "s": "seconds",
-            "millisecond": "milliseconds",
-            "ms": "milliseconds",
-            "microsecond": "microseconds",
-            "us": "microseconds",
-            "μs": "microseconds",
-            "nanosecond": "nanoseconds",
-            "ns": "nanoseconds",
-        }
-
         value, canonical_unit = parse_float_unit(
-            input_str, time_multipliers, time_aliases
+            input_str, _TIME_MULTIPLIERS, _TIME_ALIASES
         )
 
         if value is None or canonical_unit is None:
@@ -171,16 +204,18 @@ class DurationConverter(Converter):
         # Convert to float to handle both int and float inputs
         total_seconds_float = float(total_seconds_input)
 
+        # Under a minute the seconds are the only part, fractions included
+        if total_seconds_float < 60:
+            return format_units(total_seconds_float, "second")
+
         # Extract whole seconds for time unit calculations
         total_whole_seconds = int(total_seconds_float)
         fractional_seconds = total_seconds_float - total_whole_seconds
 
         # Don't include years in human readable - use precise calculations only
-        weeks = total_whole_seconds // 604800
-        days = (weeks % 604800) // 86400
-        hours = (total_whole_seconds % 86400) // 3600
-        minutes = (total_whole_seconds % 3600) // 60
-        whole_seconds_remainder = total_whole_seconds % 60
+        weeks, days, hours, minutes, whole_seconds_remainder = _split_duration(
+            total_whole_seconds
+        )
 
         # Combine whole seconds remainder with fractional part
         final_seconds = whole_seconds_remainder + fractional_seconds
@@ -201,16 +236,11 @@ class DurationConverter(Converter):
 
     def _format_subsecond_duration(self, total_seconds: float) -> str:
         """Format sub-second duration using the largest unit with no fractional part."""
-        # Try milliseconds first (1000 ms = 1 second)
-        milliseconds = total_seconds * 1000
-        if milliseconds == int(milliseconds):
-            return format_units(int(milliseconds), "millisecond")
-
-        # Try microseconds (1,000,000 μs = 1 second)
-        microseconds = total_seconds * 1000000
-        if microseconds == int(microseconds):
-            return format_units(int(microseconds), "microsecond")
-
-        # Fall back to nanoseconds (1,000,000,000 ns = 1 second)
-        nanoseconds = total_seconds * 1000000000
-        return format_units(nanoseconds, "nanosecond")
+        for _, scale, unit in _SUBSECOND_UNITS:
+            scaled = total_seconds * scale
+            if scaled == int(scaled):
+                return format_units(int(scaled), unit)
+
+        # Fall back to fractional nanoseconds
+        _, scale, unit = _SUBSECOND_UNITS[-1]
+        return format_units(total_seconds * scale, unit)
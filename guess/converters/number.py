@@ -2,23 +2,88 @@
 Number base converter for decimal, hex, binary, and octal formats.
 """
 
-import re
-from typing import Dict, Any, List
-from guess.converters.base import Converter, Interpretation
+from typing import Dict, Any, Tuple
+from guess.converters.base import Converter, Interpretation, SHAPE_DIGIT, SHAPE_LETTER
+
+# Digits allowed in each base; inputs are lowercased first
+_BINARY_DIGITS = frozenset("01")
+_OCTAL_DIGITS = frozenset("01234567")
+_HEX_DIGITS = frozenset("0123456789abcdef")
+_HEX_LETTERS = frozenset("abcdef")
+
+# Hex, binary and octal strings for the common 0-255 range
+_SMALL_INT_BASES = tuple(
+    {"Hexadecimal": f"0x{i:x}", "Binary": f"0b{i:b}", "Octal": f"0o{i:o}"}
+    for i in range(256)
+)
+
+# Every character an ASCII number in any supported format can contain
+_NUMBER_CHARS = frozenset("0123456789abcdef.ox+-")
+
+# Base, description and allowed digits for each radix prefix
+_PREFIX_FORMATS = {
+    "0x": (16, "hex", _HEX_DIGITS),
+    "0b": (2, "binary", _BINARY_DIGITS),
+    "0o": (8, "octal", _OCTAL_DIGITS),
+}
+
+
+def _is_decimal(text: str) -> bool:
+    """Check for an unsigned decimal with a fractional part, e.g. "1.5"."""
+    whole, dot, fraction = text.partition(".")
+    return bool(dot) and whole.isdecimal() and fraction.isdecimal()
+
+
+def _is_scientific(text: str) -> bool:
+    """Check for unsigned scientific notation such as "1.5e-3"."""
+    mantissa, e, exponent = text.partition("e")
+    if exponent[:1] in ("+", "-"):
+        exponent = exponent[1:]
+    return (
+        bool(e)
+        and exponent.isdecimal()
+        and (mantissa.isdecimal() or _is_decimal(mantissa))
+    )
 
 
 class NumberConverter(Converter):
     """Converts numbers between different bases."""
 
-    def get_interpretations(self, input_str: str) -> List[Interpretation]:
-        """Get all possible interpretations of the input as a number."""
-        cleaned = input_str.strip().lower()
+    # Numbers contain digits, or letters for bare hex like "ff"
+    ACCEPTS_MASK = SHAPE_DIGIT | SHAPE_LETTER
+
+    def _normalize_input(self, input_str: str) -> str:
+        """Strip and lowercase the input; prefixes and hex are case-insensitive."""
+        return input_str.strip().lower()
+
+    @classmethod
+    def _parse_input(cls, cleaned: str) -> Tuple[Interpretation, ...]:
+        """Parse a normalized input string into number interpretations."""
+        # A radix prefix rules out every other format, so prefixed input is
+        # classified and parsed in one step
+        prefix_format = _PREFIX_FORMATS.get(cleaned[:2])
+        if prefix_format is not None and len(cleaned) > 2:
+            base, description, digits = prefix_format
+            if not digits.issuperset(cleaned[2:]):
+                return ()
+            return (Interpretation(description=description, value=int(cleaned, base)),)
+
+        # Reject text such as "hello" or "12:30" up front. Non-ASCII input
+        # still goes through the checks below, since str.isdecimal and
+        # float() accept other scripts' digits.
+        if cleaned.isascii() and not _NUMBER_CHARS.issuperset(cleaned):
+            return ()
+
         interpretations = []
 
+        # Every format allows a leading minus sign; check the rest against
+        # each format's digits
+        unsigned = cleaned[1:] if cleaned.startswith("-") else cleaned
+
         # Try different number format interpretations in order of specificity
 
         # Scientific notation
-        if "e" in cleaned and re.match(r"^-?\d+(?:\.\d+)?e[+-]?\d+$", cleaned):
+        if "e" in unsigned and _is_scientific(unsigned):
             try:
                 value = float(cleaned)
                 interpretations.append(
@@ -27,20 +92,11 @@ class NumberConverter(Converter):
             except ValueError:
                 pass
 
-        # Hexadecimal patterns
-        if cleaned.startswith("0x") and re.match(r"^-?0x[0-9a-f]+$", cleaned):
-            try:
-                value = int(cleaned, 16)
-                interpretations.append(Interpretation(description="hex", value=value))
-            except ValueError:
-                pass
-        elif (
-            re.match(r"^-?[0-9a-f]+$", cleaned)
-            and any(c in cleaned for c in "abcdef")
+        # Bare hex needs at least one letter to tell it apart from decimal
+        if (
+            _HEX_DIGITS.issuperset(unsigned)
+            and not _HEX_LETTERS.isdisjoint(unsigned)
             and not cleaned.endswith("b")
-            and not cleaned.endswith("o")
-            and not cleaned.startswith("0b")
-            and not cleaned.startswith("0o")
         ):
             try:
                 value = int(cleaned, 16)
@@ -48,16 +104,12 @@ class NumberConverter(Converter):
             except ValueError:
                 pass
 
-        # Binary patterns
-        if cleaned.startswith("0b") and re.match(r"^-?0b[01]+$", cleaned):
-            try:
-                value = int(cleaned, 2)
-                interpretations.append(
-                    Interpretation(description="binary", value=value)
-                )
-            except ValueError:
-                pass
-        elif cleaned.endswith("b") and re.match(r"^-?[01]+b$", cleaned):
+        # Binary and octal suffixes, e.g. "101b" and "17o"
+        if (
+            cleaned.endswith("b")
+            and len(unsigned) > 1
+            and _BINARY_DIGITS.issuperset(unsigned[:-1])
+        ):
             try:
                 value = int(cleaned[:-1], 2)
                 interpretations.append(
@@ -65,15 +117,11 @@ class NumberConverter(Converter):
                 )
             except ValueError:
                 pass
-
-        # Octal patterns
-        if cleaned.startswith("0o") and re.match(r"^-?0o[0-7]+$", cleaned):
-            try:
-                value = int(cleaned, 8)
-                interpretations.append(Interpretation(description="octal", value=value))
-            except ValueError:
-                pass
-        elif cleaned.endswith("o") and re.match(r"^-?[0-7]+o$", cleaned):
+        elif (
+            cleaned.endswith("o")
+            and len(unsigned) > 1
+            and _OCTAL_DIGITS.issuperset(unsigned[:-1])
+        ):
             try:
                 value = int(cleaned[:-1], 8)
                 interpretations.append(Interpretation(description="octal", value=value))
@@ -81,7 +129,7 @@ class NumberConverter(Converter):
                 pass
 
         # Decimal patterns
-        if re.match(r"^-?\d+\.\d+$", cleaned):
+        if "." in unsigned and _is_decimal(unsigned):
             try:
                 value = float(cleaned)
                 interpretations.append(
@@ -89,7 +137,7 @@ class NumberConverter(Converter):
                 )
             except ValueError:
                 pass
-        elif re.match(r"^-?\d+$", cleaned):
+        elif unsigned.isdecimal():
             try:
                 value = int(cleaned)
                 interpretations.append(
@@ -98,85 +146,42 @@ class NumberConverter(Converter):
             except ValueError:
                 pass
 
-        return interpretations
+        return tuple(interpretations)
 
     def convert_value(self, value: Any) -> Dict[str, str]:
         """Convert a number value to various formats."""
         result = {}
 
         # Basic number formats
+        result["Decimal"] = str(value)
         if value >= 1_000_000:
-            result["Decimal"] = str(value)
             result["Scientific"] = f"{value:.2e}"
             # Add human readable format for large numbers
             human_readable = self._format_human_readable(value)
             if human_readable:
                 result["Human Readable"] = human_readable
         else:
-            result["Decimal"] = str(value)
             # Add human readable for smaller numbers too if applicable
             if isinstance(value, int) and value >= 100_000:
                 human_readable = self._format_human_readable(value)
                 if human_readable:
                     result["Human Readable"] = human_readable
 
-        # Only show other bases for integers
+        # Only show other bases for integers. Bytes come straight from the
+        # table; otherwise the sign and magnitude are worked out once and
+        # shared by all three bases.
         if isinstance(value, int):
-            result["Hexadecimal"] = (
-                f"0x{abs(value):x}" if value >= 0 else f"-0x{abs(value):x}"
-            )
-            result["Binary"] = (
-                f"0b{abs(value):b}" if value >= 0 else f"-0b{abs(value):b}"
-            )
-            result["Octal"] = (
-                f"0o{abs(value):o}" if value >= 0 else f"-0o{abs(value):o}"
-            )
+            if 0 <= value < 256:
+                result.update(_SMALL_INT_BASES[value])
+                return result
+            sign = "-" if value < 0 else ""
+            magnitude = -value if value < 0 else value
+            result["Hexadecimal"] = f"{sign}0x{magnitude:x}"
+            result["Binary"] = f"{sign}0b{magnitude:b}"
+            result["Octal"] = f"{sign}0o{magnitude:o}"
 
         return result
 
-    def _parse_number(self, input_str: str):
-        """Parse number from various formats."""
-        try:
-            # Scientific notation
-            if "e" in input_str:
-                return float(input_str)
-
-            # Hexadecimal
-            if input_str.startswith("0x"):
-                return int(input_str, 16)
-            elif input_str.startswith("#"):
-                return int(input_str[1:], 16)
-            elif (
-                any(c in input_str for c in "abcdef")
-                and not input_str.endswith("b")
-                and not input_str.endswith("o")
-                and not input_str.startswith("0b")
-            ):
-                return int(input_str, 16)
-
-            # Binary
-            elif input_str.startswith("0b"):
-                return int(input_str, 2)
-            elif input_str.endswith("b") and all(c in "01" for c in input_str[:-1]):
-                return int(input_str[:-1], 2)
-
-            # Octal
-            elif input_str.startswith("0o"):
-                return int(input_str, 8)
-            elif input_str.endswith("o") and all(
-                c in "01234567" for c in input_str[:-1]
-            ):
-                return int(input_str[:-1], 8)
-
-            # Decimal (int or float)
-            elif "." in input_str:
-                return float(input_str)
-            else:
-                return int(input_str)
-
-        except ValueError:
-            return None
-
     def _format_human_readable(self, num: float) -> str:
         """Format number in human readable form (million, billion, etc.)."""
         # Support range 100,000 to 1,000,000,000,000,000 (0.1 million to 1000 quadrillion)
@@ -3,20 +3,70 @@ File permission converter for octal and symbolic notation.
 """
 
 import re
-from typing import Dict, Any, List
-from guess.converters.base import Converter, Interpretation
+from typing import Dict, Any, Tuple
+from guess.converters.base import (
+    Converter,
+    Interpretation,
+    SHAPE_DASH,
+    SHAPE_DIGIT,
+    SHAPE_LETTER,
+)
+
+# Octal (755, 0755) and symbolic (rwxr-xr-x) permissions in one pattern;
+# match.lastgroup names the form that matched
+_PERMISSION_RE = re.compile(
+    r"^(?:(?P<octal>0?[0-7]{3,4})|(?P<symbolic>[rwx-]{9}))$"
+)
+
+# "rwx" letters and description for each octal digit
+_DIGIT_RWX = [
+    ("r" if digit & 4 else "-")
+    + ("w" if digit & 2 else "-")
+    + ("x" if digit & 1 else "-")
+    for digit in range(8)
+]
+_DIGIT_DESCRIPTIONS = [
+    ", ".join(
+        name for bit, name in ((4, "read"), (2, "write"), (1, "execute")) if digit & bit
+    )
+    or "none"
+    for digit in range(8)
+]
+
+# Symbolic notation and breakdown for all 512 permission values (0-0o777)
+_SYMBOLIC_TABLE = tuple(
+    _DIGIT_RWX[value >> 6] + _DIGIT_RWX[value >> 3 & 7] + _DIGIT_RWX[value & 7]
+    for value in range(512)
+)
+_BREAKDOWN_TABLE = tuple(
+    f"owner: {_DIGIT_DESCRIPTIONS[value >> 6]}, "
+    f"group: {_DIGIT_DESCRIPTIONS[value >> 3 & 7]}, "
+    f"others: {_DIGIT_DESCRIPTIONS[value & 7]}"
+    for value in range(512)
+)
+
+# Reverse of _SYMBOLIC_TABLE, from "rwxr-xr-x" style strings to values
+_SYMBOLIC_TO_OCTAL = {
+    symbolic: value for value, symbolic in enumerate(_SYMBOLIC_TABLE)
+}
 
 
 class PermissionConverter(Converter):
     """Converts file permissions between different formats."""
 
-    def get_interpretations(self, input_str: str) -> List[Interpretation]:
-        """Get all possible interpretations of the input as file permissions."""
-        cleaned = input_str.strip()
+    # Octal digits, or symbolic "rwx-" notation
+    ACCEPTS_MASK = SHAPE_DIGIT | SHAPE_LETTER | SHAPE_DASH
+
+    @classmethod
+    def _parse_input(cls, cleaned: str) -> Tuple[Interpretation, ...]:
+        """Parse a stripped input string into permission interpretations."""
         interpretations = []
 
+        match = _PERMISSION_RE.match(cleaned)
+        permission_format = match.lastgroup if match else None
+
         # Check for octal permissions (755, 0755, 0o755, etc.)
-        if re.match(r"^0?[0-7]{3,4}$", cleaned) or cleaned.startswith("0o"):
+        if permission_format == "octal" or cleaned.startswith("0o"):
             try:
                 if cleaned.startswith("0o"):
                     # Python octal notation
@@ -36,9 +86,9 @@ class PermissionConverter(Converter):
                 pass
 
         # Check for symbolic permissions (rwxr-xr-x)
-        elif re.match(r"^[rwx-]{9}$", cleaned):
+        elif permission_format == "symbolic":
             try:
-                octal_value = self._symbolic_to_octal(cleaned)
+                octal_value = cls._symbolic_to_octal(cleaned)
                 if octal_value is not None:
                     interpretations.append(
                         Interpretation(description="string", value=octal_value)
@@ -46,7 +96,7 @@ class PermissionConverter(Converter):
             except ValueError:
                 pass
 
-        return interpretations
+        return tuple(interpretations)
 
     def convert_value(self, value: Any) -> Dict[str, str]:
         """Convert a permission value to various formats."""
@@ -66,133 +116,28 @@ class PermissionConverter(Converter):
 
         return result
 
-    def _parse_permission_input(self, input_str: str):
-        """Parse permission input to octal integer."""
-        # Symbolic notation (rwxr-xr-x)
-        if len(input_str) == 9 and all(c in "rwx-" for c in input_str):
-            return self._symbolic_to_octal(input_str)
-
-        # Octal notation variations
-        if input_str.startswith("0o"):
-            # 0o755 format
-            try:
-                return int(input_str[2:], 8)
-            except ValueError:
-                return None
-        elif input_str.startswith("0") and len(input_str) == 4:
-            # 0755 format
-            try:
-                return int(input_str[1:], 8)
-            except ValueError:
-                return None
-        elif len(input_str) == 3 and all(d in "01234567" for d in input_str):
-            # 755 format
-            try:
-                return int(input_str, 8)
-            except ValueError:
-                return None
-
-        return None
-
-    def _symbolic_to_octal(self, symbolic: str) -> int:
-        """Convert symbolic notation to octal."""
-
-        def triplet_to_octal(triplet):
-            value = 0
-            if triplet[0] == "r":
-                value += 4
-            if triplet[1] == "w":
-                value += 2
-            if triplet[2] == "x":
-                value += 1
-            return value
-
-        owner = triplet_to_octal(symbolic[0:3])
-        group = triplet_to_octal(symbolic[3:6])
-        other = triplet_to_octal(symbolic[6:9])
-
-        return owner * 64 + group * 8 + other
-
-    def _octal_to_symbolic(self, octal_value: int) -> str:
-        """Convert octal to symbolic notation."""
-
-        def digit_to_rwx(digit):
-            r = "r" if digit & 4 else "-"
-            w = "w" if digit & 2 else "-"
-            x = "x" if digit & 1 else "-"
-            return r + w + x
-
-        # Extract individual digits
-        owner = (octal_value >> 6) & 7
-        group = (octal_value >> 3) & 7
-        other = octal_value & 7
-
-        return digit_to_rwx(owner) + digit_to_rwx(group) + digit_to_rwx(other)
-
-    def _format_permission_breakdown(self, octal_value: int) -> str:
-        """Format permission breakdown."""
-
-        def digit_to_description(digit):
-            perms = []
-            if digit & 4:
-                perms.append("read")
-            if digit & 2:
-                perms.append("write")
-            if digit & 1:
-                perms.append("execute")
-            return ", ".join(perms) if perms else "none"
-
-        owner = (octal_value >> 6) & 7
-        group = (octal_value >> 3) & 7
-        other = octal_value & 7
-
-        return f"owner: {digit_to_description(owner)}, group: {digit_to_description(group)}, others: {digit_to_description(other)}"
-
     def _format_breakdown(self, octal_value: int) -> str:
         """Format permission breakdown."""
-
-        def digit_to_description(digit):
-            perms = []
-            if digit & 4:
-                perms.append("read")
-            if digit & 2:
-                perms.append("write")
-            if digit & 1:
-                perms.append("execute")
-            return ", ".join(perms) if perms else "none"
-
-        owner = (octal_value >> 6) & 7
-        group = (octal_value >> 3) & 7
-        other = octal_value & 7
-
-        return f"owner: {digit_to_description(owner)}, group: {digit_to_description(group)}, others: {digit_to_description(other)}"
+        # Only the low nine bits (owner, group, other) are described
+        return _BREAKDOWN_TABLE[octal_value & 0o777]
 
     def _octal_to_symbolic(self, octal_value: int) -> str:
         """Convert octal permission to symbolic notation."""
-        symbolic = ""
-        for shift in [6, 3, 0]:  # owner, group, other
-            digit = (octal_value >> shift) & 7
-            symbolic += "r" if digit & 4 else "-"
-            symbolic += "w" if digit & 2 else "-"
-            symbolic += "x" if digit & 1 else "-"
-        return symbolic
-
-    def _symbolic_to_octal(self, symbolic: str) -> int:
+        return _SYMBOLIC_TABLE[octal_value & 0o777]
+
+    @staticmethod
+    def _symbolic_to_octal(symbolic: str) -> int:
         """Convert symbolic permission to octal value."""
         if len(symbolic) != 9:
             return None
 
-        octal_value = 0
-        for i in range(3):  # owner, group, other
-            section = symbolic[i * 3 : (i + 1) * 3]
-            digit = 0
-            if section[0] == "r":
-                digit |= 4
-            if section[1] == "w":
-                digit |= 2
-            if section[2] == "x":
-                digit |= 1
-            octal_value |= digit << (6 - i * 3)
+        octal_value = _SYMBOLIC_TO_OCTAL.get(symbolic)
+        if octal_value is None:
+            # Letters out of place (e.g. "w" where "r" belongs) simply leave
+            # that bit unset
+            octal_value = 0
+            for letter, char in zip("rwxrwxrwx", symbolic):
+                octal_value = octal_value << 1 | (char == letter)
 
         return octal_value
 
@@ -3,8 +3,10 @@ Timestamp converter for Unix timestamps and date formats.
 """
 
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from typing import Dict, Any, List
 import re
+import time
 from dateutil import parser as dateutil_parser
 from dateutil.parser import ParserError, parserinfo
 from guess.converters.base import Converter, Interpretation
@@ -12,6 +14,132 @@ from guess.converters.duration import DurationConverter
 from guess.utils import format_units
 
 
+# Shared UTC tzinfo and the strftime format for human readable local time
+_UTC = timezone.utc
+_HUMAN_READABLE_FORMAT = "%A, %B %d, %Y at %I:%M:%S %p"
+
+# Unix epoch and the unit for exact datetime to milliseconds conversion
+_EPOCH = datetime(1970, 1, 1, tzinfo=_UTC)
+_ONE_MILLISECOND = timedelta(milliseconds=1)
+
+# Time-only input such as "10:30" or "3pm"
+_TIME_ONLY_RE = re.compile(r"^[\d:]+\s*(am|pm)?$", re.IGNORECASE)
+
+# Relative time patterns and whether each points to the future
+_RELATIVE_PATTERNS = (
+    (re.compile(r"^in\s+(.+)$"), True),  # "in 5 minutes"
+    (re.compile(r"^(.+)\s+from\s+now$"), True),  # "5 minutes from now"
+    (re.compile(r"^(.+)\s+ago$"), False),  # "5 minutes ago"
+)
+
+# Common date shapes parsed without dateutil: ISO 8601 dates and datetimes,
+# and "01/15/2024" style dates
+_ISO_DATETIME_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[ T](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:?\d{2})?)?",
+    re.ASCII,
+)
+_SLASH_DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})", re.ASCII)
+
+# Digit counts of unix seconds, milliseconds and microseconds
+_TIMESTAMP_LENGTHS = frozenset((10, 13, 16))
+
+# Reasonable timestamps in seconds: 1900-01-01 to 2100-01-01 UTC
+_MIN_TIMESTAMP = -2208988800
+_MAX_TIMESTAMP = 4102444800
+
+
+@lru_cache(maxsize=4096)
+def _format_local_time(timestamp_seconds: int) -> str:
+    """Format a whole-second timestamp as human readable local time."""
+    return datetime.fromtimestamp(timestamp_seconds).strftime(_HUMAN_READABLE_FORMAT)
+
+
+# Time the cached "now" was taken, and the cached UTC datetime itself. Both
+# are replaced together in one assignment, so readers never see a mixed pair.
+_now_cache = (0.0, None)
+
+
+def _to_milliseconds(dt: datetime) -> int:
+    """
+    Convert a datetime to whole milliseconds since the Unix epoch.
+
+    Naive datetimes are local time, as with datetime.timestamp(). Only
+    whole seconds go through the float timestamp, where they are exact, so
+    milliseconds are never lost to float rounding.
+    """
+    if dt.tzinfo is None:
+        seconds = int(dt.replace(microsecond=0).timestamp())
+        return seconds * 1000 + dt.microsecond // 1000
+    return (dt - _EPOCH) // _ONE_MILLISECOND
+
+
+def _now_utc() -> datetime:
+    """
+    Get the current UTC time, refreshed at most once per second.
+
+    Relative times are shown in minutes or coarser, so a "now" up to a
+    second old is indistinguishable and saves rebuilding the datetime on
+    every conversion.
+    """
+    global _now_cache
+    taken, now_utc = _now_cache
+    now = time.time()
+    if not 0.0 <= now - taken < 1.0:
+        now_utc = datetime.fromtimestamp(now, tz=_UTC)
+        _now_cache = (now, now_utc)
+    return now_utc
+
+
+def _parse_common_datetime(input_str: str):
+    """
+    Parse the most common date shapes the same way dateutil would.
+
+    Returns None when the input has another shape or anything unusual, such
+    as an out of range field, so the caller can fall back to dateutil.
+    """
+    match = _ISO_DATETIME_RE.fullmatch(input_str)
+    if match:
+        year, first, second, hour, minute, sec, fraction, offset = match.groups()
+    else:
+        match = _SLASH_DATE_RE.fullmatch(input_str)
+        if not match:
+            return None
+        first, second, year = match.groups()
+        hour = minute = sec = fraction = offset = None
+
+    # dateutil is called with dayfirst=True, which reads the first of the two
+    # small fields as the day, even in ISO dates, unless only the second
+    # could be one
+    first, second = int(first), int(second)
+    if first <= 12 < second:
+        month, day = first, second
+    else:
+        day, month = first, second
+
+    tzinfo = None
+    if offset == "Z":
+        tzinfo = _UTC
+    elif offset:
+        hours, minutes = int(offset[1:3]), int(offset[-2:])
+        offset_seconds = hours * 3600 + minutes * 60
+        if offset_seconds >= 86400:
+            return None
+        if offset[0] == "-":
+            offset_seconds = -offset_seconds
+        tzinfo = timezone(timedelta(seconds=offset_seconds))
+
+    try:
+        if hour is None:
+            return datetime(int(year), month, day)
+        # Fractions beyond microseconds are truncated, as dateutil does
+        microsecond = int(fraction[:6].ljust(6, "0")) if fraction else 0
+        time_fields = (int(hour), int(minute), int(sec), microsecond)
+        return datetime(int(year), month, day, *time_fields, tzinfo=tzinfo)
+    except ValueError:
+        return None
+
+
 class NoHMSParserInfo(parserinfo):
     """Custom parserinfo that ignores HMS duration strings but keeps necessary jump words."""
     # Prevent hour/minute/second parsing.
@@ -22,6 +150,11 @@ class NoHMSParserInfo(parserinfo):
 class TimestampConverter(Converter):
     """Converts Unix timestamps to human-readable date formats."""
 
+    def __init__(self):
+        # Relative times like "in 5 minutes" parse their duration with one
+        # shared converter, so its interpretation cache carries across calls
+        self._duration_converter = DurationConverter()
+
     def get_interpretations(self, input_str: str) -> List[Interpretation]:
         """Get all possible interpretations of the input as a timestamp."""
         cleaned = input_str.strip()
@@ -41,22 +174,24 @@ class TimestampConverter(Converter):
 
         return interpretations
 
-    def _is_reasonable_timestamp(self, timestamp_seconds: int) -> bool:
-        """Check if a timestamp in seconds is within a reasonable range."""
-        return -2208988800 <= timestamp_seconds <= 4102444800
-
     def _parse_datetime_string(self, input_str: str) -> List[Interpretation]:
         """Parse human-readable date/datetime strings using python-dateutil."""
         interpretations = []
 
         try:
-            # Use custom parser info that ignores HMS strings and jump words to avoid conflicts with duration parsing
-            parser_info = NoHMSParserInfo()
-            dt = dateutil_parser.parse(input_str, fuzzy=False, parserinfo=parser_info, dayfirst=True)
+            # Common shapes skip dateutil, which is much slower
+            dt = _parse_common_datetime(input_str)
+            if dt is None:
+                # Use custom parser info that ignores HMS strings and jump words
+                # to avoid conflicts with duration parsing
+                parser_info = NoHMSParserInfo()
+                dt = dateutil_parser.parse(
+                    input_str, fuzzy=False, parserinfo=parser_info, dayfirst=True
+                )
 
             # Determine description based on content
             # Determine if this is a time-only input by checking if it's just time format.
-            if re.match(r'^[\d:]+\s*(am|pm)?$', input_str.strip(), re.IGNORECASE):
+            if _TIME_ONLY_RE.match(input_str.strip()):
                 description = "time"
             elif dt.time() == datetime.min.time():
                 # Midnight time suggests date-only input
@@ -65,8 +200,7 @@ class TimestampConverter(Converter):
                 # Has both date and time components
                 description = "datetime"
 
-
-            timestamp_ms = int(dt.timestamp() * 1000)
+            timestamp_ms = _to_milliseconds(dt)
             interpretations.append(
                 Interpretation(description=description, value=timestamp_ms)
             )
@@ -81,35 +215,41 @@ class TimestampConverter(Converter):
         """Parse numeric Unix timestamps in seconds, milliseconds, or microseconds."""
         interpretations = []
 
-        try:
-            timestamp = int(input_str)
-        except ValueError:
-            return interpretations
-
-        if input_str.startswith("-"):
+        negative = input_str.startswith("-")
+        if negative:
             abs_str = input_str[1:]
         else:
             abs_str = input_str
 
         length = len(abs_str)
 
+        # Only these lengths can match below, so skip int() for anything else
+        if length not in _TIMESTAMP_LENGTHS and not (negative and length >= 3):
+            return interpretations
+
+        # Plain ASCII digits only; int() would also accept "+", "_" separators
+        # and other scripts' digits, and raise on anything else
+        if not (abs_str.isascii() and abs_str.isdigit()):
+            return interpretations
+        timestamp = int(input_str)
+
         # Check for seconds interpretation (10 digits or reasonable range)
         if length == 10 or (timestamp < 0 and length >= 3):
-            if self._is_reasonable_timestamp(timestamp):
+            if _MIN_TIMESTAMP <= timestamp <= _MAX_TIMESTAMP:
                 interpretations.append(
                     Interpretation(description="unix seconds", value=timestamp * 1000)
                 )
 
         # Check for milliseconds interpretation (13 digits)
         if length == 13:
-            if self._is_reasonable_timestamp(timestamp // 1000):
+            if _MIN_TIMESTAMP <= timestamp // 1000 <= _MAX_TIMESTAMP:
                 interpretations.append(
                     Interpretation(description="unix milliseconds", value=timestamp)
                 )
 
         # Check for microseconds interpretation (16 digits)
         if length == 16:
-            if self._is_reasonable_timestamp(timestamp // 1000000):
+            if _MIN_TIMESTAMP <= timestamp // 1000000 <= _MAX_TIMESTAMP:
                 interpretations.append(
                     Interpretation(description="unix microseconds", value=timestamp // 1000)
                 )
@@ -122,19 +262,12 @@ class TimestampConverter(Converter):
 
         # Handle "now"
         if cleaned == "now":
-            now_ms = int(datetime.now(tz=timezone.utc).timestamp() * 1000)
+            now_ms = _to_milliseconds(_now_utc())
             return [Interpretation(description="relative time", value=now_ms)]
 
-        # Define patterns with their future/past indicators
-        patterns = [
-            (r'^in\s+(.+)$', True),           # "in 5 minutes"
-            (r'^(.+)\s+from\s+now$', True),   # "5 minutes from now"
-            (r'^(.+)\s+ago$', False),         # "5 minutes ago"
-        ]
-
         # Try each pattern
-        for pattern, is_future in patterns:
-            match = re.match(pattern, cleaned)
+        for pattern, is_future in _RELATIVE_PATTERNS:
+            match = pattern.match(cleaned)
             if match:
                 duration_str = match.group(1)
                 return self._create_relative_interpretation(duration_str, is_future)
@@ -145,14 +278,16 @@ class TimestampConverter(Converter):
         """Create a relative time interpretation from a duration string."""
         interpretations = []
 
-        duration_interpretations = DurationConverter().get_interpretations(duration_str)
+        duration_interpretations = self._duration_converter.get_interpretations(
+            duration_str
+        )
         for duration_interpretation in duration_interpretations:
             duration_seconds = duration_interpretation.value
             if not is_future:
                 duration_seconds = -duration_seconds
-            target_time = datetime.now(tz=timezone.utc) + timedelta(seconds=duration_seconds)
+            target_time = _now_utc() + timedelta(seconds=duration_seconds)
 
-            target_ms = int(target_time.timestamp() * 1000)
+            target_ms = _to_milliseconds(target_time)
             interpretations.append(
                 Interpretation(description="relative time", value=target_ms)
             )
@@ -168,21 +303,25 @@ class TimestampConverter(Converter):
             # Convert to seconds for datetime operations
             timestamp_seconds = timestamp_ms / 1000
 
-            # Create datetime objects
-            dt_utc = datetime.fromtimestamp(timestamp_seconds, tz=timezone.utc)
-            dt_local = datetime.fromtimestamp(timestamp_seconds)
+            dt_utc = datetime.fromtimestamp(timestamp_seconds, tz=_UTC)
 
             # Calculate relative time
-            now = datetime.now(tz=timezone.utc)
+            now = _now_utc()
             time_diff = now - dt_utc
             relative_time = self._format_relative_time(time_diff)
 
+            # UTC datetimes always end in "+00:00"; only the tail needs swapping
+            iso_8601 = dt_utc.isoformat()
+            if iso_8601.endswith("+00:00"):
+                iso_8601 = iso_8601[:-6] + "Z"
+
             # Format results
             result = {
                 "Unix Seconds": f"{int(timestamp_seconds)} (unix seconds)",
-                "ISO 8601": dt_utc.isoformat().replace("+00:00", "Z"),
+                "ISO 8601": iso_8601,
                 "Relative": relative_time,
-                "Human Readable": dt_local.strftime("%A, %B %d, %Y at %I:%M:%S %p"),
+                # Only whole seconds are shown, so the floor is the cache key
+                "Human Readable": _format_local_time(timestamp_ms // 1000),
             }
 
             # Add microseconds if there's subsecond precision (non-zero milliseconds part)
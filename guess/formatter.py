@@ -54,12 +54,8 @@ class TableFormatter:
         # Use the specific interpretation description for accurate labeling
         lines.append(f"{converter_name} from {interpretation_description}:")
 
-        # Track seen values to avoid duplicates
-        seen_values = set()
-        for value in formats.values():
-            if value not in seen_values:
-                lines.append(f"  {value}")
-                seen_values.add(value)
+        # Skip duplicate values; dict keys keep first-seen order
+        lines.extend(f"  {value}" for value in dict.fromkeys(formats.values()))
 
         return "\n".join(lines)
 
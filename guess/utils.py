@@ -102,6 +102,6 @@ def format_units(value: Union[int, float], unit: str) -> str:
     formatted_value = format_number_clean(value)
     # Use the formatted value for pluralization to ensure consistency
     # This handles cases where 1.002 becomes "1" after formatting
-    is_singular = (formatted_value == "1")
-    plural_unit = unit + ('' if is_singular else 's')
-    return f"{formatted_value} {plural_unit}"
+    if formatted_value == "1":
+        return f"1 {unit}"
+    return f"{formatted_value} {unit}s"
@@ -0,0 +1,88 @@
+"""
+Tests for the base converter module.
+"""
+
+import pytest
+
+from guess.converters import base
+from guess.converters.base import (
+    SHAPE_COLON,
+    SHAPE_DASH,
+    SHAPE_DIGIT,
+    SHAPE_DOT,
+    SHAPE_LETTER,
+    SHAPE_OTHER,
+    input_shape,
+)
+from guess.converters.color import ColorConverter
+from guess.converters.duration import DurationConverter
+from guess.converters.number import NumberConverter
+from guess.converters.permission import PermissionConverter
+
+
+class TestInputShape:
+    """Test classification of input characters into SHAPE_* bits."""
+
+    @pytest.mark.parametrize(
+        "input_str, shape",
+        [
+            ("255", SHAPE_DIGIT),
+            ("\u0663\u00b2", SHAPE_DIGIT),  # Arabic-Indic three, superscript two
+            (".", SHAPE_DOT),
+            (":", SHAPE_COLON),
+            ("abcXYZ", SHAPE_LETTER),
+            ("\u00e9\u0436", SHAPE_LETTER),  # e-acute, Cyrillic zhe
+            ("-", SHAPE_DASH),
+            ("#+/%", SHAPE_OTHER),
+        ],
+    )
+    def test_single_character_class(self, input_str, shape):
+        """Test that each character class sets only its own bit."""
+        assert input_shape(input_str) == shape
+
+    def test_mixed_input(self):
+        """Test that mixed input sets the bit of every class it contains."""
+        assert input_shape("1.5gb") == SHAPE_DIGIT | SHAPE_DOT | SHAPE_LETTER
+        assert input_shape("rwxr-xr-x") == SHAPE_LETTER | SHAPE_DASH
+        assert input_shape("12:30:00") == SHAPE_DIGIT | SHAPE_COLON
+        assert input_shape("#ff0000") == SHAPE_DIGIT | SHAPE_LETTER | SHAPE_OTHER
+
+    def test_whitespace_is_ignored(self):
+        """Test that whitespace sets no bits."""
+        assert input_shape("") == 0
+        assert input_shape(" \t\n") == 0
+        assert input_shape("1 h") == SHAPE_DIGIT | SHAPE_LETTER
+
+
+# Converters relying on the inherited get_interpretations, with an input and
+# a differently formatted input that normalizes to the same string
+CACHED_CONVERTERS = [
+    (ColorConverter, "#abc", "  #abc  "),
+    (DurationConverter, "1h30m", " 1H30M "),
+    (NumberConverter, "abc", " ABC "),
+    (PermissionConverter, "rw-r--r--", "  rw-r--r--  "),
+]
+
+
+class TestCachedInterpretations:
+    """Test memoization of parsed interpretations in the base converter."""
+
+    def setup_method(self):
+        """Start every test from an empty cache."""
+        base._parse_cached.cache_clear()
+
+    @pytest.mark.parametrize("converter_class, input_str, variant", CACHED_CONVERTERS)
+    def test_repeated_input_parsed_once(self, converter_class, input_str, variant):
+        """Test that normalized repeats hit the cache, even across instances."""
+        interpretations = converter_class().get_interpretations(input_str)
+        assert len(interpretations) == 1
+        assert base._parse_cached.cache_info().misses == 1
+
+        # Callers get a fresh list, so modifying it leaves the cache intact
+        expected = list(interpretations)
+        interpretations.clear()
+        assert converter_class().get_interpretations(variant) == expected
+
+        cache_info = base._parse_cached.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 1
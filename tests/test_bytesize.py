@@ -75,6 +75,8 @@ class TestByteSizeConverter:
         assert len(self.converter.get_interpretations("abc")) == 0  # Non-numeric
         assert len(self.converter.get_interpretations("1XB")) == 0  # Invalid unit
         assert len(self.converter.get_interpretations("-1")) == 0  # Negative size
+        assert len(self.converter.get_interpretations("²")) == 0  # Non-decimal digit
+        assert len(self.converter.get_interpretations("1_024")) == 0  # Underscore
 
     def test_convert_value_basic_formats(self):
         """Test that convert_value produces all expected output formats."""
@@ -120,6 +120,7 @@ class TestColorConverter:
         assert len(self.converter.get_interpretations("notacolor")) == 0  # Invalid name
         assert len(self.converter.get_interpretations("#GG0000")) == 0  # Invalid hex
         assert len(self.converter.get_interpretations("#FF00")) == 0  # Wrong hex length
+        assert len(self.converter.get_interpretations("#f f")) == 0  # Embedded space
         assert (
             len(self.converter.get_interpretations("#FF00000")) == 0
         )  # Wrong hex length
@@ -181,6 +182,19 @@ class TestColorConverter:
         result = self.converter.convert_value((0, 0, 255))
         assert "hsl(240, 100%, 50%)" in result["HSL"]
 
+    def test_whole_and_fractional_channels_give_same_hsl(self):
+        """Test that the lookup table path matches dividing float channels."""
+        for rgb in [(0, 0, 0), (255, 255, 255), (0, 0, 255), (12, 200, 77),
+                    (128, 128, 127), (1, 254, 3)]:
+            floats = tuple(float(channel) for channel in rgb)
+            assert self.converter._whole_rgb_to_hsl(*rgb) == (
+                self.converter._rgb_to_hsl(*floats)
+            )
+            assert (
+                self.converter.convert_value(rgb)["HSL"]
+                == self.converter.convert_value(floats)["HSL"]
+            )
+
     def test_convert_value_rgb_percent_precision(self):
         """Test RGB percent output precision."""
         # Test precise float values
@@ -0,0 +1,120 @@
+"""
+Tests for the conversion dispatch in guess.convert.
+"""
+
+import pytest
+
+from guess.convert import iter_convert, try_convert
+from guess.converters.base import SHAPE_DIGIT, SHAPE_LETTER, Converter
+from guess.converters.bytesize import ByteSizeConverter
+from guess.converters.color import ColorConverter
+from guess.converters.duration import DurationConverter
+from guess.converters.number import NumberConverter
+from guess.converters.permission import PermissionConverter
+
+
+class FailingConverter(Converter):
+    """Converter that fails the test if the dispatcher ever runs it."""
+
+    def get_interpretations(self, input_str):
+        raise AssertionError("converter should not have been run")
+
+    def convert_value(self, value):
+        raise AssertionError("converter should not have been run")
+
+    def get_name(self):
+        return "Failing"
+
+    def choose_display_value(self, formats, interpretation_description):
+        return None
+
+
+class RecordingConverter(Converter):
+    """Converter that records the inputs it is asked to interpret."""
+
+    def __init__(self, accepts_mask):
+        self.ACCEPTS_MASK = accepts_mask
+        self.seen = []
+
+    def get_interpretations(self, input_str):
+        self.seen.append(input_str)
+        return []
+
+    def convert_value(self, value):
+        return {}
+
+    def get_name(self):
+        return "Recording"
+
+    def choose_display_value(self, formats, interpretation_description):
+        return None
+
+
+def all_converters():
+    """Converters whose output does not depend on the current time."""
+    return [
+        NumberConverter(),
+        ByteSizeConverter(),
+        DurationConverter(),
+        ColorConverter(),
+        PermissionConverter(),
+    ]
+
+
+class TestIterConvert:
+    """Test the lazy iter_convert generator."""
+
+    def test_stops_after_requested_result(self):
+        """Test that taking one result never runs the later converters."""
+        results = iter_convert("255", [NumberConverter(), FailingConverter()])
+
+        result = next(results)
+        assert result.converter_name == "Number"
+        assert result.interpretation_description == "decimal"
+
+    def test_no_converters_run_before_iteration(self):
+        """Test that creating the generator does no work by itself."""
+        iter_convert("255", [FailingConverter()])
+
+    @pytest.mark.parametrize(
+        "input_str", ["255", "0xff", "1.5gb", "1h30m", "#abc", "rwxr-xr-x", "hello"]
+    )
+    def test_matches_try_convert(self, input_str):
+        """Test that iterating yields exactly what try_convert returns."""
+        converters = all_converters()
+        assert list(iter_convert(input_str, converters)) == try_convert(
+            input_str, converters
+        )
+
+
+class TestShapeGate:
+    """Test that converters are skipped when the input shape cannot match."""
+
+    def test_mask_miss_skips_converter(self):
+        """Test that only converters accepting a class in the input are run."""
+        digits_only = RecordingConverter(SHAPE_DIGIT)
+        letters = RecordingConverter(SHAPE_LETTER)
+
+        assert try_convert("abc", [digits_only, letters]) == []
+        assert digits_only.seen == []
+        assert letters.seen == ["abc"]
+
+    def test_permission_reaches_converter(self):
+        """Test that symbolic permissions get past the gate."""
+        results = try_convert("rwxr-xr-x", all_converters())
+        assert [result.converter_name for result in results] == ["Permission"]
+        assert results[0].formats["Octal"] == "0755"
+
+    def test_letters_never_reach_numeric_converters(self, monkeypatch):
+        """Test that letter-only input skips byte size and duration parsing."""
+        converters = all_converters()
+        for converter in converters:
+            if isinstance(converter, (ByteSizeConverter, DurationConverter)):
+                monkeypatch.setattr(
+                    converter,
+                    "get_interpretations",
+                    FailingConverter().get_interpretations,
+                )
+
+        results = try_convert("abc", converters)
+        assert [result.converter_name for result in results] == ["Number"]
@@ -102,6 +102,8 @@ class TestDurationConverter:
         )  # Non-numeric/duration
         assert len(self.converter.get_interpretations("1x 2y")) == 0  # Invalid units
         assert len(self.converter.get_interpretations("-1")) == 0  # Negative duration
+        assert len(self.converter.get_interpretations("inf")) == 0  # Not finite
+        assert len(self.converter.get_interpretations("nan")) == 0  # Not a number
 
     def test_convert_value_basic_formats(self):
         """Test that convert_value produces all expected output formats."""
@@ -114,6 +116,10 @@ class TestDurationConverter:
         assert result["Seconds"] == "3661 seconds"
         assert result["Human Readable"] == "1 hour, 1 minute, 1 second"
 
+        # Days left over after whole weeks are kept
+        result = self.converter.convert_value(10 * 86400 + 3661)
+        assert result["Human Readable"] == "1 week, 3 days, 1 hour, 1 minute, 1 second"
+
     def test_convert_value_with_years(self):
         """Test conversion of large durations that include years output."""
         # Test with a duration longer than 1 year
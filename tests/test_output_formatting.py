@@ -146,6 +146,19 @@ class TestOutputFormatting:
             output = formatter._format_single_result(result)
             assert expected_label in output
 
+    def test_single_result_skips_duplicate_values(self):
+        """Test that repeated format values are shown once, in order."""
+        formatter = TableFormatter()
+
+        result = ConversionResult(
+            converter_name="Number",
+            interpretation_description="input",
+            formats={"Decimal": "8", "Human": "8", "Octal": "0o10", "Other": "8"},
+            display_value="8"
+        )
+        output = formatter._format_single_result(result)
+        assert output.split("\n")[1:] == ["  8", "  0o10"]
+
     def test_multiple_interpretation_labels(self):
         """Test labels for multiple interpretation mode."""
         formatter = TableFormatter()
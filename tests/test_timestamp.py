@@ -2,7 +2,13 @@
 Tests for the timestamp converter.
 """
 
-from guess.converters.timestamp import TimestampConverter
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from guess.converters import timestamp
+from guess.converters.timestamp import TimestampConverter, _parse_common_datetime
 
 
 class TestTimestampConverter:
@@ -45,6 +51,8 @@ class TestTimestampConverter:
         assert (
             len(self.converter.get_interpretations("0")) == 0
         )  # Too short for valid timestamp
+        assert len(self.converter.get_interpretations("1_23456789")) == 0  # Separators
+        assert len(self.converter.get_interpretations("+123456789")) == 0  # Plus sign
 
     def test_convert_value_basic_formats(self):
         """Test that convert_value produces all expected output formats."""
@@ -82,6 +90,13 @@ class TestTimestampConverter:
         assert "Unix Microseconds" in result
         assert result["Unix Microseconds"] == "1234567890123000 (unix microseconds)"
 
+        # Human readable time shows whole seconds, rounding down before 1970 too
+        whole = self.converter.convert_value(1234567890000)
+        assert result["Human Readable"] == whole["Human Readable"]
+        before_epoch = self.converter.convert_value(-500)
+        second_before = self.converter.convert_value(-1000)
+        assert before_epoch["Human Readable"] == second_before["Human Readable"]
+
     def test_get_name(self):
         """Test converter name."""
         assert self.converter.get_name() == "Timestamp"
@@ -129,6 +144,17 @@ class TestTimestampConverter:
         interpretations = converter.get_interpretations("2024-01-15T10:30:00Z")
         assert len(interpretations) > 0
         assert interpretations[0].description == "datetime"
+        utc_value = interpretations[0].value
+
+        # UTC offsets and fractional seconds
+        interpretations = converter.get_interpretations("2024-01-15T12:30:00.250+02:00")
+        assert len(interpretations) > 0
+        assert interpretations[0].description == "datetime"
+        assert interpretations[0].value == utc_value + 250
+
+        # Milliseconds are exact, not truncated after float rounding
+        interpretations = converter.get_interpretations("2039-06-13T14:56:00.003Z")
+        assert interpretations[0].value == 2191589760003
 
         # US date formats
         interpretations = converter.get_interpretations("01/15/2024")
@@ -283,6 +309,8 @@ class TestTimestampConverter:
         interpretations = converter.get_interpretations("now")
         assert len(interpretations) == 1
         assert interpretations[0].description == "relative time"
+        # The cached "now" is at most a second old
+        assert abs(interpretations[0].value - time.time() * 1000) < 2000
 
         # Test "in <duration>"
         interpretations = converter.get_interpretations("in 5 minutes")
@@ -310,3 +338,100 @@ class TestTimestampConverter:
 
         interpretations = converter.get_interpretations("5 minutes")  # Missing "ago" or "in"
         assert len(interpretations) == 0
+
+
+class TestNowUtc:
+    """Test the once-per-second cache of the current UTC time."""
+
+    def test_refreshes_after_a_second(self, monkeypatch):
+        """Test that "now" is reused within a second and refreshed after."""
+        clock = [1700000000.25]
+        monkeypatch.setattr(timestamp.time, "time", lambda: clock[0])
+        monkeypatch.setattr(timestamp, "_now_cache", (0.0, None))
+
+        first = timestamp._now_utc()
+        assert first == datetime.fromtimestamp(1700000000.25, tz=timezone.utc)
+
+        # Within the same second the cached datetime is returned as is
+        clock[0] += 0.5
+        assert timestamp._now_utc() is first
+
+        clock[0] += 1.0
+        refreshed = timestamp._now_utc()
+        assert refreshed == datetime.fromtimestamp(1700000001.75, tz=timezone.utc)
+        assert timestamp._now_cache == (1700000001.75, refreshed)
+
+    def test_refreshes_when_clock_goes_back(self, monkeypatch):
+        """Test that a clock set backwards does not keep a future "now"."""
+        clock = [1700000000.0]
+        monkeypatch.setattr(timestamp.time, "time", lambda: clock[0])
+        monkeypatch.setattr(timestamp, "_now_cache", (0.0, None))
+
+        timestamp._now_utc()
+        clock[0] -= 0.5
+        assert timestamp._now_utc() == datetime.fromtimestamp(
+            1699999999.5, tz=timezone.utc
+        )
+
+
+class TestParseCommonDatetime:
+    """Test the fast path for common date shapes against dateutil's quirks."""
+
+    @pytest.mark.parametrize(
+        "input_str, expected",
+        [
+            # dayfirst=True reads the first small field as the day, even in ISO
+            ("2024-01-02", datetime(2024, 2, 1)),
+            # ...unless only the second field can be the day
+            ("2024-13-01", datetime(2024, 1, 13)),
+            ("05/03/2024", datetime(2024, 3, 5)),
+            ("03/25/2024", datetime(2024, 3, 25)),
+            # Without an offset the result is naive, meaning local time
+            ("2024-01-15 10:30:00", datetime(2024, 1, 15, 10, 30)),
+            (
+                "2024-01-15T10:30:00Z",
+                datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc),
+            ),
+            # Digits beyond microseconds are truncated, not rounded
+            (
+                "2024-01-15T10:30:00.1234569Z",
+                datetime(2024, 1, 15, 10, 30, 0, 123456, tzinfo=timezone.utc),
+            ),
+        ],
+    )
+    def test_matches_dateutil(self, input_str, expected):
+        """Test that common shapes parse exactly as dateutil parses them."""
+        dt = _parse_common_datetime(input_str)
+        assert dt == expected
+        assert dt.utcoffset() == expected.utcoffset()
+
+        parsed = timestamp.dateutil_parser.parse(
+            input_str, parserinfo=timestamp.NoHMSParserInfo(), dayfirst=True
+        )
+        assert parsed == dt
+        assert parsed.utcoffset() == dt.utcoffset()
+
+    def test_out_of_range_offset_falls_back_to_dateutil(self, monkeypatch):
+        """Test that a +24:00 offset is left for dateutil to handle."""
+        input_str = "2024-01-15T10:30:00+24:00"
+        assert _parse_common_datetime(input_str) is None
+
+        calls = []
+        parse = timestamp.dateutil_parser.parse
+
+        def recording_parse(text, *args, **kwargs):
+            calls.append(text)
+            return parse(text, *args, **kwargs)
+
+        monkeypatch.setattr(timestamp.dateutil_parser, "parse", recording_parse)
+        interpretations = TimestampConverter().get_interpretations(input_str)
+
+        # dateutil rejects the offset too, so there is no date interpretation
+        assert calls == [input_str]
+        assert interpretations == []
+
+    def test_uncommon_shapes_fall_back(self):
+        """Test that other shapes and impossible dates are not parsed."""
+        assert _parse_common_datetime("January 15, 2024") is None
+        assert _parse_common_datetime("2024-02-30") is None
+        assert _parse_common_datetime("10:30") is None